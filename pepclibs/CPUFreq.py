@@ -124,6 +124,17 @@ _FEATURES = {
     },
 }
 
+# Per-CPU cpufreq sysfs files for the 'CPUFREQ_KEYS_DESCR' keys.
+_POLICY_FILES = {
+    "min_limit" : "cpuinfo_min_freq",
+    "max_limit" : "cpuinfo_max_freq",
+    "min" : "scaling_min_freq",
+    "max" : "scaling_max_freq",
+    "governor" : "scaling_governor",
+    "governors" : "scaling_available_governors",
+    "epp_policy" : "energy_performance_preference",
+}
+
 class CPUFreq:
     """This class provides API for managing CPU frequency. Only Intel x86 systems are supported."""
 
@@ -136,11 +147,15 @@ class CPUFreq:
     def _read(self, path):
         """Read cpufreq sysfs file."""
 
+        if path in self._sysfs_cache:
+            return self._sysfs_cache[path]
         return FSHelpers.read(path, proc=self._proc)
 
     def _read_int(self, path, default=_RAISE):
         """Read an integer from cpufreq sysfs file."""
 
+        if path in self._sysfs_cache and Trivial.is_int(self._sysfs_cache[path]):
+            return int(self._sysfs_cache[path])
         if default is _RAISE:
             return FSHelpers.read_int(path, proc=self._proc)
         return FSHelpers.read_int(path, default=default, proc=self._proc)
@@ -148,6 +163,7 @@ class CPUFreq:
     def _write(self, path, data):
         """Write into cpufreq sysfs file."""
 
+        self._sysfs_cache.pop(path, None)
         FSHelpers.write(path, data, proc=self._proc)
 
     def _get_cpuinfo(self):
@@ -161,7 +177,7 @@ class CPUFreq:
         """Returns a 'CPUInfo.get_lscpu_info()' object."""
 
         if not self._lscpu_info:
-            self._lscpu_info = CPUInfo.get_lscpu_info(proc=self._proc)
+            self._lscpu_info = self._get_cpuinfo().get_lscpu_info()
         return self._lscpu_info
 
     def _get_msr(self):
@@ -176,7 +192,7 @@ class CPUFreq:
 
         path = self._sysfs_base / "cpufreq" / f"policy{cpu}" / "energy_performance_preference"
         with contextlib.suppress(Error):
-            return FSHelpers.read(path, proc=self._proc)
+            return self._read(path)
         return None
 
     def _get_epp_policies(self):
@@ -189,7 +205,7 @@ class CPUFreq:
         # same for other CPUs.
         path = self._sysfs_epp_policies
         with contextlib.suppress(Error):
-            self._epp_policies = FSHelpers.read(path, proc=self._proc).split()
+            self._epp_policies = self._read(path).split()
 
         if not self._epp_policies:
             self._epp_policies = []
@@ -279,9 +295,53 @@ class CPUFreq:
         platform_freqs = self._get_platform_freqs(0)
         return self._get_base_freq(0) != platform_freqs["max_turbo"]
 
+    def _prefetch_policy_files(self, cpus, keys):
+        """
+        Read all the per-CPU cpufreq sysfs files needed for 'keys' at once and add them to
+        'self._sysfs_cache'. On a remote host this takes a single round-trip instead of one
+        round-trip per file per CPU.
+        """
+
+        names = [name for key, name in _POLICY_FILES.items() if key in keys]
+        if "base" in keys:
+            names += ["base_frequency", "scaling_max_freq"]
+        # The "max" and "base" keys both need 'scaling_max_freq'.
+        names = list(dict.fromkeys(names))
+        if not names:
+            return
+
+        paths = []
+        if "driver" in keys:
+            paths.append(self._sysfs_base / "cpufreq" / "policy0" / "scaling_driver")
+        if "epp_policies" in keys and self._epp_policies is None:
+            paths.append(self._sysfs_epp_policies)
+        for cpu in cpus:
+            basedir = self._sysfs_base / "cpufreq" / f"policy{cpu}"
+            paths += [basedir / name for name in names]
+
+        self._sysfs_cache.update(FSHelpers.read_files(paths, proc=self._proc))
+
     def _get_cpufreq_info(self, cpus, keys, fail_on_unsupported):
         """Implements 'get_cpufreq_info()'."""
 
+        # The prefetched values are valid only while the information is being yielded, a later
+        # call has to see the changes made in between. But this may be a nested call, made while
+        # the caller iterates over an outer call, so drop the values only when the outermost call
+        # finishes. Note, 'self._write()' drops the values of the files it writes to.
+        if self._proc.is_remote:
+            self._prefetch_policy_files(cpus, keys)
+
+        self._sysfs_cache_users += 1
+        try:
+            yield from self._do_get_cpufreq_info(cpus, keys, fail_on_unsupported)
+        finally:
+            self._sysfs_cache_users -= 1
+            if not self._sysfs_cache_users:
+                self._sysfs_cache = {}
+
+    def _do_get_cpufreq_info(self, cpus, keys, fail_on_unsupported):
+        """Implements '_get_cpufreq_info()'."""
+
         # Resolve global attributes first.
         if keys.intersection(["turbo_supported", "turbo_enabled"]):
             turbo_enabled = self._is_turbo_enabled()
@@ -880,7 +940,7 @@ class CPUFreq:
                 self._validate_epp_policy(epp)
                 path = self._sysfs_base / "cpufreq" / f"policy{cpu}" / \
                        "energy_performance_preference"
-                FSHelpers.write(path, epp, proc=self._proc)
+                self._write(path, epp)
 
     def set_feature(self, feature, val, cpus="all"):
         """
@@ -933,6 +993,9 @@ class CPUFreq:
         self._epb_supported = None
         self._epp_supported = None
         self._epp_policies = None
+        self._sysfs_cache = {}
+        # Count of the 'get_cpufreq_info()' generators using 'self._sysfs_cache'.
+        self._sysfs_cache_users = 0
 
         basedir = self._sysfs_base / "intel_uncore_frequency"
         self._ufreq_supported = FSHelpers.exists(basedir, self._proc)
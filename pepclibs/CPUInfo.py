@@ -11,10 +11,14 @@ This module provides an API to get CPU information.
 """
 
 import re
-from itertools import groupby
+import logging
+import weakref
+from pathlib import Path
 from pepclibs.helperlibs.Exceptions import Error # pylint: disable=unused-import
 from pepclibs.helperlibs import ArgParse, Procs, Trivial
 
+_LOG = logging.getLogger()
+
 # CPU model numbers.
 INTEL_FAM6_SAPPHIRERAPIDS_X = 0x8F # Sapphire Rapids Xeon.
 INTEL_FAM6_ALDERLAKE = 0x97        # Alder Lake client.
@@ -77,7 +81,113 @@ CPU_DESCR = {INTEL_FAM6_SAPPHIRERAPIDS_X: "Sapphire Rapids Xeon",
              INTEL_FAM6_GOLDMONT_D:       "Goldmont Atom (Denverton)",
              INTEL_FAM6_TREMONT_D:        "Tremont Atom (Snow Ridge)"}
 
+# CPU model descriptions indexed by CPU model number. Same as 'CPU_DESCR', but without hashing.
+_CPU_DESCR_TBL = tuple(CPU_DESCR.get(model) for model in range(0x100))
+
+def cpu_descr(model, default=None):
+    """Return description of CPU model 'model' or 'default' if the CPU model is unknown."""
+
+    if isinstance(model, int) and 0 <= model < len(_CPU_DESCR_TBL):
+        descr = _CPU_DESCR_TBL[model]
+        if descr is not None:
+            return descr
+    return default
+
 LEVELS = ("pkg", "node", "core", "cpu")
+# Level name to level index map.
+_LEVEL_IDX = {lvl: idx for idx, lvl in enumerate(LEVELS)}
+# Index of the last non-CPU level.
+_LAST_LVL_IDX = len(LEVELS) - 2
+
+# The 'lscpu' output labels we are interested in, the corresponding 'get_lscpu_info()' keys, and
+# the value types. Integer values are left as strings if they cannot be converted (e.g., "-").
+_LSCPU_KEYS = {"Architecture": ("arch", str),
+               "Byte Order": ("byteorder", str),
+               "Vendor ID": ("vendor", str),
+               "Socket(s)": ("packages", int),
+               "CPU family": ("family", int),
+               "Model": ("model", int),
+               "Model name": ("modelname", str),
+               "Stepping": ("stepping", int),
+               "L1d cache": ("l1d", str),
+               "L1i cache": ("l1i", str),
+               "L2 cache": ("l2", str),
+               "L3 cache": ("l3", str),
+               "Flags": ("flags", str)}
+
+# Matches the base frequency part of the CPU model name, for example "... CPU @ 2.40GHz".
+_BASEFREQ_RE = re.compile(r"@\s*([^@]*)GHz$")
+
+# The CPU topology does not change while the process runs (unless CPUs are onlined or offlined),
+# so the 'lscpu' output and the CPU geometry are shared by all 'CPUInfo' objects using the same
+# 'proc' object. These are dictionaries indexed by the 'proc' object. The host name is not used as
+# the key, because different 'proc' objects may have the same host name (e.g., "localhost"), but
+# provide different data (e.g., mocked 'proc' objects in the tests).
+_LSCPU_CACHE = weakref.WeakKeyDictionary()
+_GEOM_CACHE = weakref.WeakKeyDictionary()
+
+# The local host 'Procs.Proc()' object used by default, see '_get_default_proc()'.
+_DEFAULT_LOCAL_PROC = None
+
+# Separates outputs of the 'lscpu' commands when they are run as a single command.
+_LSCPU_SEPARATOR = "--- pepc lscpu separator ---"
+
+def _lscpu_int(val):
+    """Convert an 'lscpu' value 'val' to an integer if possible, otherwise return it as is."""
+
+    try:
+        return int(val)
+    except ValueError:
+        return val
+
+def _get_default_proc():
+    """
+    Return the 'Procs.Proc()' object used when the caller did not provide a 'proc' object. The
+    object is created only once and then re-used, so that 'CPUInfo' objects created without 'proc'
+    share the cached CPU topology.
+    """
+
+    global _DEFAULT_LOCAL_PROC # pylint: disable=global-statement
+
+    # Note, compare the type in order to re-create the object if 'Procs.Proc' was replaced, like the
+    # tests do.
+    if type(_DEFAULT_LOCAL_PROC) is not Procs.Proc: # pylint: disable=unidiomatic-typecheck
+        _DEFAULT_LOCAL_PROC = Procs.Proc()
+    return _DEFAULT_LOCAL_PROC
+
+def _parse_lscpu_info(lscpu):
+    """Parse the 'lscpu' command output 'lscpu' and return the result as a dictionary."""
+
+    cpuinfo = {}
+
+    # Parse misc. information about the CPU.
+    for line in lscpu:
+        # Every line looks like "Label: value".
+        label, sep, val = line.partition(":")
+        if not sep:
+            continue
+
+        keyinfo = _LSCPU_KEYS.get(label.strip())
+        if keyinfo is None:
+            continue
+
+        key, typ = keyinfo
+        val = val.strip()
+        if typ is int:
+            val = _lscpu_int(val)
+        cpuinfo[key] = val
+
+    # The base frequency is a part of the model name.
+    modelname = cpuinfo.get("modelname")
+    if isinstance(modelname, str):
+        match = _BASEFREQ_RE.search(modelname)
+        if match:
+            cpuinfo["basefreq"] = _lscpu_int(match.group(1))
+
+    if cpuinfo.get("flags"):
+        cpuinfo["flags"] = cpuinfo["flags"].split()
+
+    return cpuinfo
 
 def get_lscpu_info(proc=None):
     """
@@ -89,90 +199,251 @@ def get_lscpu_info(proc=None):
     """
 
     if not proc:
-        proc = Procs.Proc()
+        proc = _get_default_proc()
 
-    cpuinfo = {}
     lscpu, _ = proc.run_verify("lscpu", join=False)
+    return _parse_lscpu_info(lscpu)
 
-    # Parse misc. information about the CPU.
-    patterns = ((r"^Architecture:\s*(.*)$", "arch"),
-                (r"^Byte Order:\s*(.*)$", "byteorder"),
-                (r"^Vendor ID:\s*(.*)$", "vendor"),
-                (r"^Socket\(s\):\s*(.*)$", "packages"),
-                (r"^CPU family:\s*(.*)$", "family"),
-                (r"^Model:\s*(.*)$", "model"),
-                (r"^Model name:\s*(.*)$", "modelname"),
-                (r"^Model name:.*@\s*(.*)GHz$", "basefreq"),
-                (r"^Stepping:\s*(.*)$", "stepping"),
-                (r"^L1d cache:\s*(.*)$", "l1d"),
-                (r"^L1i cache:\s*(.*)$", "l1i"),
-                (r"^L2 cache:\s*(.*)$", "l2"),
-                (r"^L3 cache:\s*(.*)$", "l3"),
-                (r"^Flags:\s*(.*)$", "flags"))
+def _nums_key(nums):
+    """
+    Returns a hashable version of 'nums', which is a list of numbers or a string with a
+    comma-separated list of numbers.
+    """
 
-    for line in lscpu:
-        for pattern, key in patterns:
-            match = re.match(pattern, line.strip())
-            if not match:
-                continue
+    if isinstance(nums, (str, int)):
+        return nums
+    return tuple(nums)
 
-            val = match.group(1)
-            if Trivial.is_int(val):
-                cpuinfo[key] = int(val)
-            else:
-                cpuinfo[key] = val
+def _group_ranges(nums):
+    """
+    Group consequative numbers in the sorted unique list 'nums'. Returns a tuple of two lists: the
+    list of lists of consequtive numbers, and the list of range strings (e.g., "0-3" or "5") for
+    every group.
+    """
 
-    if cpuinfo.get("flags"):
-        cpuinfo["flags"] = cpuinfo["flags"].split()
+    if not nums:
+        return [], []
 
-    return cpuinfo
+    # The most common case is that all the numbers are consequtive (e.g., all CPUs are online), and
+    # since the numbers are sorted and unique, this can be checked without walking the list.
+    if nums[-1] - nums[0] == len(nums) - 1:
+        if len(nums) == 1:
+            return [list(nums)], [str(nums[0])]
+        return [list(nums)], [f"{nums[0]}-{nums[-1]}"]
+
+    # Find indexes where the ranges start, then slice the groups out of 'nums' at once instead of
+    # appending the numbers one by one.
+    starts = [0]
+    starts += [idx for idx, (prev, num) in enumerate(zip(nums, nums[1:]), 1) if num - prev != 1]
+    ends = starts[1:] + [len(nums)]
+
+    grouped = [nums[start:end] for start, end in zip(starts, ends)]
+    ranges = [f"{grp[0]}-{grp[-1]}" if len(grp) > 1 else str(grp[0]) for grp in grouped]
+
+    return grouped, ranges
 
 class CPUInfo:
     """
     Provide information about the CPU of a local or remote host.
     """
 
+    def _read_sysfs_list(self, path):
+        """Read a sysfs file with a list of numbers (e.g., "0-3,8") and return it as a list."""
+
+        with self._proc.open(path, "r") as fobj:
+            return ArgParse.parse_int_list(fobj.read().strip(), ints=True)
+
+    def _get_topology_from_sysfs(self):
+        """
+        Walk sysfs and build the CPU topology information in the same format as the 'lscpu --all
+        -p=socket,node,core,cpu,online' command does: list of "pkg,node,core,cpu,Y" lines for
+        online CPUs and ",,,cpu,N" lines for offline CPUs.
+        """
+
+        cpus = self._read_sysfs_list(self._sysfs_base / "present")
+        online = set(self._read_sysfs_list(self._sysfs_base / "online"))
+
+        # Map CPU numbers to NUMA node numbers. There may be no NUMA nodes information if the kernel
+        # was built without NUMA support, in which case all CPUs belong to node 0.
+        cpu_to_node = {}
+        try:
+            nodes = self._read_sysfs_list(self._nodes_sysfs_base / "online")
+        except Error:
+            nodes = []
+        for node in nodes:
+            for cpu in self._read_sysfs_list(self._nodes_sysfs_base / f"node{node}" / "cpulist"):
+                cpu_to_node[cpu] = node
+
+        # Read the topology information only for the first CPU of every package and core, the other
+        # CPUs are covered by the siblings lists. Note, Linux core numbers are package-relative,
+        # while 'lscpu' uses globally unique core numbers. Mimic 'lscpu' and number cores in the
+        # order they appear.
+        cpu_to_pkg = {}
+        cpu_to_core = {}
+        corecnt = 0
+
+        lines = []
+        for cpu in cpus:
+            if cpu not in online:
+                lines.append(f",,,{cpu},N")
+                continue
+
+            base = self._sysfs_base / f"cpu{cpu}" / "topology"
+            if cpu not in cpu_to_pkg:
+                with self._proc.open(base / "physical_package_id", "r") as fobj:
+                    pkg = int(fobj.read().strip())
+                for sibling in self._read_sysfs_list(base / "core_siblings_list"):
+                    cpu_to_pkg[sibling] = pkg
+                cpu_to_pkg[cpu] = pkg
+            if cpu not in cpu_to_core:
+                for sibling in self._read_sysfs_list(base / "thread_siblings_list"):
+                    cpu_to_core[sibling] = corecnt
+                cpu_to_core[cpu] = corecnt
+                corecnt += 1
+
+            lines.append(f"{cpu_to_pkg[cpu]},{cpu_to_node.get(cpu, 0)},{cpu_to_core[cpu]},{cpu},Y")
+
+        return lines
+
     def _get_lscpu(self):
-        """Return the 'lscpu' output."""
+        """
+        Return the 'lscpu' output. On the local host, the CPU topology information is read directly
+        from sysfs instead, which is much faster than running 'lscpu'.
+        """
 
         if self._lscpu_cache:
             return self._lscpu_cache
 
-        # Note, we could just walk sysfs, but 'lscpu' seems a bit more convenient.
-        cmd = "lscpu --all -p=socket,node,core,cpu,online"
-        self._lscpu_cache, _ = self._proc.run_verify(cmd, join=False)
+        if self._proc.is_remote:
+            self._fetch_all()
+        else:
+            try:
+                self._lscpu_cache = self._get_topology_from_sysfs()
+            except Error as err:
+                _LOG.debug("failed to read CPU topology from sysfs, falling back to 'lscpu':\n%s",
+                           err)
+                cmd = "lscpu --all -p=socket,node,core,cpu,online"
+                self._lscpu_cache, _ = self._proc.run_verify(cmd, join=False)
+
+        _LSCPU_CACHE[self._proc] = self._lscpu_cache
         return self._lscpu_cache
 
-    def _get_level(self, start, end, nums=None):
+    def _fetch_all(self):
         """
-        Returns list of level 'end' values belonging to level 'start' for each ID in 'nums'. Returns
-        all values if 'nums' is None or "all". Offline CPUs are ignored.
+        Run both 'lscpu' and 'lscpu --all -p=socket,node,core,cpu,online' with a single command in
+        order to save a round-trip to a remote host. Save the outputs in 'self._lscpu_info_cache'
+        and 'self._lscpu_cache'.
         """
 
-        if start not in LEVELS or end not in LEVELS:
-            levels = ", ".join(LEVELS)
-            raise Error(f"bad levels '{start}','{end}', use: {levels}")
+        cmd = f"lscpu; echo '{_LSCPU_SEPARATOR}'; lscpu --all -p=socket,node,core,cpu,online"
+        stdout, _ = self._proc.run_verify(cmd, join=False)
 
-        start_idx = LEVELS.index(start)
-        end_idx = LEVELS.index(end)
-        if start_idx > end_idx:
-            raise Error(f"bad level order, cannot get {end}s from level '{start}'")
+        for idx, line in enumerate(stdout):
+            if line.strip() == _LSCPU_SEPARATOR:
+                break
+        else:
+            raise Error(f"unexpected output of the following command{self.hostmsg}:\n{cmd}")
 
-        items = {}
+        self._lscpu_info_cache = stdout[:idx]
+        self._lscpu_cache = stdout[idx + 1:]
+
+    def get_lscpu_info(self):
+        """
+        Same as the module-level 'get_lscpu_info()', but the result is cached. In case of a remote
+        host, the 'lscpu' output is fetched together with the CPU topology information, which saves
+        a round-trip.
+        """
+
+        if self._lscpu_info:
+            return self._lscpu_info
+
+        if not self._lscpu_info_cache:
+            if self._proc.is_remote:
+                self._fetch_all()
+            else:
+                self._lscpu_info_cache, _ = self._proc.run_verify("lscpu", join=False)
+
+        self._lscpu_info = _parse_lscpu_info(self._lscpu_info_cache)
+        return self._lscpu_info
+
+    def _get_topo_rows(self):
+        """
+        Parse the 'lscpu' output and return the list of '(pkg, node, core, cpu, online)' tuples, one
+        tuple per CPU. The 'online' element is a boolean, and offline CPUs have 'None' instead of
+        package, node, and core numbers. The result is cached, so 'lscpu' output is parsed only
+        once.
+        """
+
+        if self._topo_rows is not None:
+            return self._topo_rows
+
+        self._topo_rows = []
         for line in self._get_lscpu():
             if line.startswith("#"):
                 continue
             # Each line has comma-separated integers for socket, node, core and cpu. For example:
             # 1,1,9,61,Y. In case of offline CPU, the final element is going to be "N".
-            line = line.strip().split(",")
-            if line[-1] != "Y":
-                # Skip non-online CPUs.
-                continue
-            line = [int(val) for val in line[0:-1]]
-            if line[start_idx] in items.keys():
-                items[line[start_idx]].append(line[end_idx])
+            pkg, node, core, cpu, online = line.strip().split(",")
+            if online != "Y":
+                self._topo_rows.append((None, None, None, int(cpu), False))
             else:
-                items[line[start_idx]] = [line[end_idx]]
+                self._topo_rows.append((int(pkg), int(node), int(core), int(cpu), True))
+
+        return self._topo_rows
+
+    def _get_topology(self):
+        """
+        Return the list of '(pkg, node, core, cpu)' tuples for every online CPU. The result is
+        cached.
+        """
+
+        if self._topology is not None:
+            return self._topology
+
+        rows = self._get_topo_rows()
+
+        # The per-level columns are indexed by CPU number and contain 'None' for offline and
+        # non-existing CPUs.
+        ncpus = max((row[3] for row in rows), default=-1) + 1
+        self._topo_cols = {lvl: [None] * ncpus for lvl in LEVELS[:-1]}
+        pkg_of = self._topo_cols["pkg"]
+        node_of = self._topo_cols["node"]
+        core_of = self._topo_cols["core"]
+
+        self._topology = []
+        for pkg, node, core, cpu, online in rows:
+            if not online:
+                continue
+            self._topology.append((pkg, node, core, cpu))
+
+            pkg_of[cpu] = pkg
+            node_of[cpu] = node
+            core_of[cpu] = core
+
+        return self._topology
+
+    def _get_level_map(self, start, end):
+        """
+        Returns a dictionary with keys being the 'start' level elements and values being lists of
+        the 'end' level elements. The dictionary is built only once for every '(start, end)' pair.
+        """
+
+        key = (start, end)
+        if key in self._level_cache:
+            return self._level_cache[key]
+
+        start_idx = _LEVEL_IDX[start]
+        end_idx = _LEVEL_IDX[end]
+
+        items = {}
+        seen = set()
+        for nums in self._get_topology():
+            start_num = nums[start_idx]
+            end_num = nums[end_idx]
+            if (start_num, end_num) in seen:
+                continue
+            seen.add((start_num, end_num))
+            items.setdefault(start_num, []).append(end_num)
 
         # So now 'items' is a dictionary with keys being the 'start' level elements and values being
         # lists of the 'end' level elements.
@@ -183,10 +454,40 @@ class CPUInfo:
         # In this example, package 0 includes CPUs with even numbers, and package 1 includes CPUs
         # with odd numbers.
 
+        self._level_cache[key] = items
+        return items
+
+    def _get_level(self, start, end, nums=None):
+        """
+        Returns list of level 'end' values belonging to level 'start' for each ID in 'nums'. Returns
+        all values if 'nums' is None or "all". Offline CPUs are ignored.
+        """
+
+        start_idx = _LEVEL_IDX.get(start)
+        end_idx = _LEVEL_IDX.get(end)
+        if start_idx is None or end_idx is None:
+            levels = ", ".join(LEVELS)
+            raise Error(f"bad levels '{start}','{end}', use: {levels}")
+
+        if start_idx > end_idx:
+            raise Error(f"bad level order, cannot get {end}s from level '{start}'")
+
+        items = self._get_level_map(start, end)
+
         if nums is None or nums == "all":
-            nums = list(items.keys())
-        else:
-            nums = ArgParse.parse_int_list(nums, ints=True, dedup=True, sort=True)
+            key = (start, end)
+            if key not in self._level_all_cache:
+                result = []
+                for vals in items.values():
+                    result += vals
+                self._level_all_cache[key] = Trivial.list_dedup(result)
+            return list(self._level_all_cache[key])
+
+        key = (start, end, _nums_key(nums))
+        if key in self._nums_cache:
+            return list(self._nums_cache[key])
+
+        nums = ArgParse.parse_int_list(nums, ints=True, dedup=True, sort=True)
 
         result = []
         for num in nums:
@@ -195,7 +496,8 @@ class CPUInfo:
                 raise Error(f"{start} {num} does not exist{self.hostmsg}, use: {items_str}")
             result += items[num]
 
-        return Trivial.list_dedup(result)
+        self._nums_cache[key] = Trivial.list_dedup(result)
+        return list(self._nums_cache[key])
 
     def get_cpus(self):
         """Returns list of online CPU numbers."""
@@ -234,12 +536,15 @@ class CPUInfo:
     def get_cpu_list(self, cpus):
         """Validate CPUs in 'cpus'. Returns CPU numbers as list of integers."""
 
-        allcpus = self.get_cpus()
-
         if cpus is None or cpus == "all":
-            return allcpus
+            return self.get_cpus()
+
+        key = ("cpu_list", _nums_key(cpus))
+        if key in self._nums_cache:
+            return list(self._nums_cache[key])
 
-        allcpus = set(allcpus)
+        # The level map is keyed by the online CPU numbers, so use it for validation.
+        allcpus = self._get_level_map("cpu", "cpu")
         cpus = ArgParse.parse_int_list(cpus, ints=True, dedup=True, sort=True)
         for cpu in cpus:
             if cpu not in allcpus:
@@ -247,17 +552,21 @@ class CPUInfo:
                 raise Error(f"CPU{cpu} is not available{self.hostmsg}, available CPUs are: "
                             f"{cpus_str}")
 
-        return cpus
+        self._nums_cache[key] = cpus
+        return list(cpus)
 
     def get_package_list(self, pkgs):
         """Validate packages in 'pkgs'. Returns packages as list of integers."""
 
-        allpkgs = self.get_packages()
-
         if pkgs is None or pkgs == "all":
-            return allpkgs
+            return self.get_packages()
+
+        key = ("package_list", _nums_key(pkgs))
+        if key in self._nums_cache:
+            return list(self._nums_cache[key])
 
-        allpkgs = set(allpkgs)
+        # The level map is keyed by the package numbers, so use it for validation.
+        allpkgs = self._get_level_map("pkg", "pkg")
         pkgs = ArgParse.parse_int_list(pkgs, ints=True, dedup=True, sort=True)
         for pkg in pkgs:
             if pkg not in allpkgs:
@@ -265,74 +574,66 @@ class CPUInfo:
                 raise Error(f"package '{pkg}' not available{self.hostmsg}, available "
                             f"packages are: {pkgs_str}")
 
-        return pkgs
+        self._nums_cache[key] = pkgs
+        return list(pkgs)
 
-    def cpu_to_package(self, cpu):
-        """Returns integer package number for CPU number 'cpu'."""
+    def _cpu_to_level(self, cpu, lvl):
+        """Returns the level 'lvl' number (e.g., package number) for CPU number 'cpu'."""
 
-        for pkg in self.get_packages():
-            if cpu in self.pkgs_to_cpus(pkgs=pkg):
-                return pkg
+        self._get_topology()
+        column = self._topo_cols[lvl]
 
-        allcpus = self.get_cpus()
-        cpus_str = ", ".join([str(cpu) for cpu in sorted(allcpus)])
-        raise Error(f"CPU{cpu} is not available{self.hostmsg}, available CPUs are:\n"
-                    f"{cpus_str}")
+        num = None
+        if Trivial.is_int(cpu) and 0 <= int(cpu) < len(column):
+            num = column[int(cpu)]
 
-    def cpu_to_core(self, cpu):
-        """Returns integer core number for CPU number 'cpu'."""
+        if num is None:
+            allcpus = self.get_cpus()
+            cpus_str = ", ".join([str(cpu) for cpu in sorted(allcpus)])
+            raise Error(f"CPU{cpu} is not available{self.hostmsg}, available CPUs are:\n"
+                        f"{cpus_str}")
+
+        return num
 
-        for core in self.get_cores():
-            if cpu in self.cores_to_cpus(cores=core):
-                return core
+    def cpu_to_package(self, cpu):
+        """Returns integer package number for CPU number 'cpu'."""
+        return self._cpu_to_level(cpu, "pkg")
 
-        allcpus = self.get_cpus()
-        cpus_str = ", ".join([str(cpu) for cpu in sorted(allcpus)])
-        raise Error(f"CPU{cpu} is not available{self.hostmsg}, available CPUs are:\n"
-                    f"{cpus_str}")
+    def cpu_to_core(self, cpu):
+        """Returns integer core number for CPU number 'cpu'."""
+        return self._cpu_to_level(cpu, "core")
 
     def _add_nums(self, nums):
-        """Add numbers from 'lscpu' to the CPU geometry dictionary."""
+        """
+        Add the '(pkg, node, core, cpu)' numbers 'nums' to the CPU geometry dictionary. The full
+        hierarchy is added to 'cpugeom["pkgs"]', and the partial hierarchies ('cpugeom["nodes"]',
+        etc) are populated at the same time. The partial hierarchies refer to the same objects as
+        the full hierarchy.
+        """
 
         item = self.cpugeom[LEVELS[0] + "s"]
         for idx, lvl in enumerate(LEVELS[:-1]):
-            last_level = False
-            if idx == len(LEVELS) - 2:
-                last_level = True
+            last_level = idx == _LAST_LVL_IDX
 
-            num = int(nums[lvl])
+            num = nums[idx]
             if num not in item:
                 self.cpugeom[lvl + "cnt"] += 1
                 if last_level:
                     item[num] = []
                 else:
                     item[num] = {}
+                if idx:
+                    self.cpugeom[lvl + "s"][num] = item[num]
 
             if last_level:
                 lvl = LEVELS[-1]
-                item[num].append(int(nums[lvl]))
+                cpu = nums[idx + 1]
+                item[num].append(cpu)
+                self.cpugeom[lvl + "s"].append(cpu)
                 self.cpugeom[lvl + "cnt"] += 1
 
             item = item[num]
 
-    def _flatten_to_level(self, items, idx):
-        """Flatten the multi-level 'items' dictionary down to level 'idx'."""
-
-        if idx == 0:
-            return items
-
-        result = {}
-        for item in items.values():
-            add_items = self._flatten_to_level(item, idx - 1)
-            if isinstance(add_items, list):
-                if not result:
-                    result = []
-                result += add_items
-            else:
-                result.update(add_items)
-
-        return result
-
     def get_cpu_geometry(self):
         """
         Get CPU geometry information. The resulting geometry dictionary is returnd and also saved in
@@ -360,51 +661,31 @@ class CPUInfo:
         for lvl in LEVELS:
             cpugeom[lvl + "cnt"] = 0
 
+        # The lowest level of the hierarchy is a list of CPU numbers.
+        cpugeom[LEVELS[-1] + "s"] = []
+
         # List of offline CPUs. Note, Linux does not provide topology information for offline CPUs,
         # so we only have the CPU numbers.
         cpugeom["offcpus"] = []
         # Offline CPUs count.
         cpugeom["offcpucnt"] = 0
 
-        # Parse the 'lscpu' output.
-        for line in self._get_lscpu():
-            if line.startswith("#"):
-                continue
-
-            split_line = line.strip().split(",")
-            nums = {key : split_line[idx] for idx, key in enumerate(LEVELS)}
-            if split_line[-1] != "Y":
+        for nums in self._get_topo_rows():
+            if not nums[-1]:
                 cpugeom["offcpucnt"] += 1
-                cpugeom["offcpus"].append(int(nums["cpu"]))
+                cpugeom["offcpus"].append(nums[3])
                 continue
 
             self._add_nums(nums)
 
-        # Now we have the full hierarcy (in 'cpugeom["pkgs"]'). Create partial hierarchies
-        # ('cpugom["nodes"]', etc).
-        for lvlidx, lvl in enumerate(LEVELS[1:]):
-            cpugeom[lvl + "s"] = self._flatten_to_level(cpugeom[LEVELS[0] + "s"], lvlidx + 1)
-
-        # Sort CPU lists by CPU number.
-        for lvl in LEVELS:
-            cpugeom[lvl + "s_sorted"] = sorted(cpugeom[lvl + "s"])
-        cpugeom["offcpus_sorted"] = sorted(cpugeom["offcpus"])
-
-        # Group consequative CPU numbers into ranges. The end result is list of lists of consequtive
-        # CPU numbers. Do the same for packages, nodes and all the other levels.
-        for lvl in LEVELS:
-            # This is the grouping function that subtracts list index from CPU number.
-            keyfunc = lambda elt: int(elt[1]) - elt[0]
-            for pfx in ("", "off"):
-                if pfx == "off" and lvl != LEVELS[-1]:
-                    continue
-                for _, grp in groupby(enumerate(cpugeom[pfx + lvl + "s_sorted"]), keyfunc):
-                    cpugeom[pfx + lvl + "s_grouped"].append([elt[1] for elt in grp])
-                for cpus in cpugeom[pfx + lvl + "s_grouped"]:
-                    if len(cpus) == 1:
-                        cpugeom[pfx + lvl + "_ranges"].append(str(cpus[0]))
-                    else:
-                        cpugeom[pfx + lvl + "_ranges"].append(f"{cpus[0]}-{cpus[-1]}")
+        # Sort the numbers and group consequative numbers into ranges. The grouped result is list of
+        # lists of consequtive numbers. Do this for CPUs, offline CPUs, packages, nodes and all the
+        # other levels.
+        for pfx, lvl in [("", lvl) for lvl in LEVELS] + [("off", LEVELS[-1])]:
+            name = pfx + lvl
+            cpugeom[name + "s_sorted"] = sorted(cpugeom[name + "s"])
+            cpugeom[name + "s_grouped"], cpugeom[name + "_ranges"] = \
+                _group_ranges(cpugeom[name + "s_sorted"])
 
         for lvl1 in LEVELS[1:]:
             for lvl2 in LEVELS[:-1]:
@@ -418,8 +699,24 @@ class CPUInfo:
                 except ZeroDivisionError:
                     cpugeom[key] = 0
 
+        _GEOM_CACHE[self._proc] = cpugeom
         return cpugeom
 
+    @classmethod
+    def invalidate_cache(cls, proc=None):
+        """
+        Drop the 'lscpu' output and CPU geometry shared by 'CPUInfo' objects using the 'proc' object
+        (all 'proc' objects by default). This should be done when CPUs are onlined or offlined, so
+        that 'CPUInfo' objects created afterwards pick up the new topology.
+        """
+
+        if proc is None:
+            _LSCPU_CACHE.clear()
+            _GEOM_CACHE.clear()
+        else:
+            _LSCPU_CACHE.pop(proc, None)
+            _GEOM_CACHE.pop(proc, None)
+
     def __init__(self, proc=None):
         """
         The class constructor. The 'proc' argument is a 'Proc' or 'SSH' object that defines the
@@ -428,15 +725,36 @@ class CPUInfo:
         """
 
         if not proc:
-            proc = Procs.Proc()
+            proc = _get_default_proc()
 
         self._proc = proc
 
         self.hostname = proc.hostname
         self.hostmsg = proc.hostmsg
-        self.cpugeom = None
-
-        self._lscpu_cache = None
+        # The CPU geometry, may be shared with other 'CPUInfo' objects using the same 'proc' object.
+        self.cpugeom = _GEOM_CACHE.get(proc)
+
+        self._sysfs_base = Path("/sys/devices/system/cpu")
+        self._nodes_sysfs_base = Path("/sys/devices/system/node")
+
+        self._lscpu_cache = _LSCPU_CACHE.get(proc)
+        # The 'lscpu' output and its parsed version (see 'get_lscpu_info()').
+        self._lscpu_info_cache = None
+        self._lscpu_info = None
+        # The parsed 'lscpu' output: list of '(pkg, node, core, cpu, online)' tuples for all CPUs,
+        # and list of '(pkg, node, core, cpu)' tuples for online CPUs.
+        self._topo_rows = None
+        self._topology = None
+        # The '(start, end)' level maps built by '_get_level_map()'.
+        self._level_cache = {}
+        # The de-duplicated lists of all 'end' level elements for every '(start, end)' pair.
+        self._level_all_cache = {}
+        # The results of 'get_cpu_list()', 'get_package_list()', 'cores_to_cpus()' and the like for
+        # the numbers the user asked for, keyed by the method and the (hashable) numbers.
+        self._nums_cache = {}
+        # The package, NUMA node, and core numbers of online CPUs. This is a dictionary indexed by
+        # level name, and the values are lists indexed by CPU number.
+        self._topo_cols = None
 
     def close(self):
         """Uninitialize the class object."""
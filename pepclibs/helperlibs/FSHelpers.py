@@ -29,6 +29,10 @@ DEBUGFS_MOUNT_POINT = Path("/sys/kernel/debug")
 # A unique object used as the default value for the 'default' key in some functions.
 _RAISE = object()
 
+# The longest command 'read_files()' runs on a remote host. The command runs as 'sh -c <command>',
+# so it is a single argument, which Linux limits to 128KiB ('MAX_ARG_STRLEN').
+_READ_FILES_CMD_MAX = 64 * 1024
+
 _LOG = logging.getLogger()
 
 def get_sha512(path, default=_RAISE, proc=None, skip_lines=0):
@@ -655,6 +659,59 @@ def read(path, default=_RAISE, proc=None):
 
     return val
 
+def read_files(paths, proc=None):
+    """
+    Read multiple small files, such as sysfs attributes, and return a dictionary mapping each path
+    to the stripped contents of the file. Files that could not be read are not included in the
+    dictionary. On a remote host the files are read with as few commands as the command length limit
+    allows, which saves a round-trip per file. Other arguments are same as in 'read()'.
+
+    Note, on a remote host the files are read with 'grep', which prints nothing for an empty file,
+    so empty files are not included in the dictionary either. The callers should handle them the
+    same way as the files that could not be read.
+    """
+
+    if not proc:
+        proc = Procs.Proc()
+
+    paths = [Path(path) for path in paths]
+    if not proc.is_remote:
+        result = {}
+        for path in paths:
+            val = read(path, default=None, proc=proc)
+            if val is not None:
+                result[path] = val
+        return result
+
+    if not paths:
+        return {}
+
+    # Split the paths into batches, so that every command fits the command length limit.
+    prefix = "grep -H '' --"
+    suffix = " 2>/dev/null"
+    batches = [[]]
+    cmdlen = len(prefix) + len(suffix)
+    for path in paths:
+        arg = f" '{path}'"
+        if batches[-1] and cmdlen + len(arg) > _READ_FILES_CMD_MAX:
+            batches.append([])
+            cmdlen = len(prefix) + len(suffix)
+        batches[-1].append(arg)
+        cmdlen += len(arg)
+
+    lines = {}
+    for batch in batches:
+        # Files which do not exist or can't be read make 'grep' exit with a non-zero code, but the
+        # contents of all the other files are still printed, so do not verify the exit code.
+        stdout, _, _ = proc.run(prefix + "".join(batch) + suffix, join=False)
+
+        for line in stdout:
+            path, sep, val = line.rstrip("\n").partition(":")
+            if sep:
+                lines.setdefault(Path(path), []).append(val)
+
+    return {path: "\n".join(vals).strip() for path, vals in lines.items()}
+
 def read_int(path, default=_RAISE, proc=None):
     """Read an integer from file 'path'. Other arguments are same as in 'read()'."""
 
@@ -12,6 +12,7 @@ human-readable format, or turning human-oriented data into a machine format.
 """
 
 from itertools import groupby
+from operator import itemgetter
 from pepclibs.helperlibs import Trivial
 from pepclibs.helperlibs.Exceptions import Error
 
@@ -203,6 +204,13 @@ def parse_duration_ns(htime, default_unit="ns", name=None):
     ns = int(tokens.get("ns", 0))
     return ms * 1000 * 1000 + us * 1000 + ns
 
+def _range_key(elt):
+    """
+    The grouping function for 'rangify()'. The 'elt' argument is an '(index, number)' tuple, and
+    the result is the same for all consequtive numbers.
+    """
+    return elt[0] - elt[1]
+
 def rangify(numbers):
     """
     Turn list of numbers in 'numbers' to a string of comma-separated ranges. Numbers can be integers
@@ -217,12 +225,12 @@ def rangify(numbers):
 
     range_strs = []
     numbers = sorted(numbers)
-    for _, pairs in groupby(enumerate(numbers), lambda x:x[0]-x[1]):
+    for _, pairs in groupby(enumerate(numbers), _range_key):
         # The 'pairs' is an iterable of tuples (enumerate value, number). E.g. 'numbers'
         # [5,6,7,8,10,11,13] would result in three iterable groups:
         # ((0, 5), (1, 6), (2, 7), (3, 8)) , ((4, 10), (5, 11)) and  (6, 13)
 
-        nums = [val for _, val in pairs]
+        nums = list(map(itemgetter(1), pairs))
         if len(nums) > 2:
             range_strs.append(f"{nums[0]}-{nums[-1]}")
         else:
@@ -13,7 +13,7 @@ Registers. This module has been designed and implemented for Intel CPUs.
 
 import logging
 from pathlib import Path
-from pepclibs.helperlibs import Procs, Logging, FSHelpers, KernelModule
+from pepclibs.helperlibs import Procs, FSHelpers, KernelModule
 from pepclibs.helperlibs.Exceptions import Error
 from pepclibs import CPUInfo
 
@@ -47,9 +47,7 @@ MSR_HWP_REQUEST = 0x774
 PKG_CONTROL = 42
 EPP_VALID = 60
 
-OWN_NAME="MSR.py"
 _LOG = logging.getLogger()
-Logging.setup_logger(prefix=OWN_NAME)
 
 def bit_mask(bitnr):
     """Return bitmask for a bit by its number."""
@@ -16,7 +16,6 @@ from pepclibs.helperlibs import Procs
 from pepclibs.helperlibs.Exceptions import Error, ErrorNotSupported
 from pepclibs import CPUInfo
 from pepclibs.msr import MSR
-from pepclibs.CPUInfo import CPU_DESCR as _CPU_DESCR
 
 _LOG = logging.getLogger()
 
@@ -133,8 +132,8 @@ class PCStateConfigCtl:
 
         if "cpumodels" in feature and model not in feature["cpumodels"]:
             fmt = "%s (CPU model %#x)"
-            cpus_str = "\n* ".join([fmt % (CPUInfo.CPU_DESCR[model], model) for model in \
-                                    feature["cpumodels"]])
+            cpus_str = "\n* ".join([fmt % (CPUInfo.cpu_descr(model, default=hex(model)), model)
+                                    for model in feature["cpumodels"]])
             msg = f"The '{feature['name']}' feature is not supported{self._proc.hostmsg} - CPU " \
                   f"'{self._lscpu_info['vendor']}, (CPU model {hex(model)})' is not supported.\n" \
                   f"The currently supported CPU models are:\n* {cpus_str}"
@@ -159,8 +158,9 @@ class PCStateConfigCtl:
         if limit_val is None:
             codes_str = ", ".join(codes)
             aliases_str = ", ".join(aliases)
+            descr = CPUInfo.cpu_descr(model, default=self._lscpu_info.get("modelname", hex(model)))
             raise Error(f"cannot limit package C-state{self._proc.hostmsg}, '{pcs_limit}' is "
-                        f"not supported for CPU {_CPU_DESCR[model]} (CPU model {hex(model)}).\n"
+                        f"not supported for CPU {descr} (CPU model {hex(model)}).\n"
                         f"Supported package C-states are: {codes_str}.\n"
                         f"Supported package C-state alias names are: {aliases_str}")
         return limit_val
@@ -348,7 +348,10 @@ class PCStateConfigCtl:
         self._msr = MSR.MSR(proc=self._proc)
 
         if self._lscpu_info is None:
-            self._lscpu_info = CPUInfo.get_lscpu_info(proc=self._proc)
+            if self._cpuinfo:
+                self._lscpu_info = self._cpuinfo.get_lscpu_info()
+            else:
+                self._lscpu_info = CPUInfo.get_lscpu_info(proc=self._proc)
 
         if self._lscpu_info["vendor"] != "GenuineIntel":
             msg = f"unsupported CPU model '{self._lscpu_info['vendor']}', model-specific " \
@@ -357,7 +360,7 @@ class PCStateConfigCtl:
                   f"only on Intel platforms."
             raise ErrorNotSupported(msg)
 
-        if self._lscpu_info["model"] not in CPUInfo.CPU_DESCR:
+        if CPUInfo.cpu_descr(self._lscpu_info["model"]) is None:
             raise ErrorNotSupported(f"unsupported CPU model '{self._lscpu_info['vendor']}'"
                                     f"{self._proc.hostmsg}")
 
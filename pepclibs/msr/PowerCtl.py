@@ -68,8 +68,8 @@ class PowerCtl:
 
         if "cpumodels" in feature and model not in feature["cpumodels"]:
             fmt = "%s (CPU model %#x)"
-            cpus_str = "\n* ".join([fmt % (CPUInfo.CPU_DESCR[model], model) for model in \
-                                    feature["cpumodels"]])
+            cpus_str = "\n* ".join([fmt % (CPUInfo.cpu_descr(model, default=hex(model)), model)
+                                    for model in feature["cpumodels"]])
             raise ErrorNotSupported(f"The '{feature['name']}' feature is not supported"
                                     f"{self._proc.hostmsg} - CPU '{self._lscpu_info['vendor']}, "
                                     f"(CPU model {hex(model)})' is not supported.\nThe supported "
@@ -127,7 +127,10 @@ class PowerCtl:
         self._msr = MSR.MSR(proc=self._proc, cpuinfo=cpuinfo)
 
         if self._lscpu_info is None:
-            self._lscpu_info = CPUInfo.get_lscpu_info(proc=self._proc)
+            if cpuinfo:
+                self._lscpu_info = cpuinfo.get_lscpu_info()
+            else:
+                self._lscpu_info = CPUInfo.get_lscpu_info(proc=self._proc)
 
         if self._lscpu_info["vendor"] != "GenuineIntel":
             raise ErrorNotSupported(f"unsupported CPU model '{self._lscpu_info['vendor']}', "
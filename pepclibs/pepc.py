@@ -12,18 +12,13 @@
 pepc - Power, Energy, and Performance Configuration tool for Linux.
 """
 
+import os
 import sys
 import logging
 import argparse
-try:
-    import argcomplete
-except ImportError:
-    # We can live without argcomplete, we only lose tab completions.
-    argcomplete = None
 
-from pepclibs.helperlibs import ArgParse, Procs, Logging, SSH, Trivial, Human
+from pepclibs.helperlibs import ArgParse, Logging, Trivial, Human
 from pepclibs.helperlibs.Exceptions import Error
-from pepclibs import ASPM, CPUIdle, CPUInfo, CPUOnline, CPUFreq
 
 if sys.version_info < (3,6):
     raise SystemExit("Error: this tool requires python version 3.6 or higher")
@@ -32,7 +27,39 @@ VERSION = "1.1.1"
 OWN_NAME = "pepc"
 
 LOG = logging.getLogger()
-Logging.setup_logger(prefix=OWN_NAME)
+
+# The SSH options by their short and long names.
+_SSH_OPTIONS_MAP = {name: opt for opt in ArgParse.SSH_OPTIONS for name in (opt.short, opt.long) \
+                    if name}
+
+# The top-level 'pepc' commands (see 'build_arguments_parser()').
+_COMMANDS = ("cpu-hotplug", "cstates", "pstates", "aspm")
+
+# The already built arguments parsers, indexed by the tuple of command names the sub-commands were
+# built for (see 'build_arguments_parser()'). Parsing does not change the parser, so it can be
+# re-used if 'main()' is called more than once, e.g., by the tests.
+_PARSERS = {}
+
+# Help text fragments shared by many command-line options.
+_CPU_LIST_TXT = """The list can include individual CPU numbers and CPU number ranges. For example,
+                   '1-4,7,8,10-12' would mean CPUs 1 to 4, CPUs 7, 8, and 10 to 12. Use the special
+                   keyword 'all' to specify all CPUs"""
+_CORE_LIST_TXT = """The list can include individual core numbers and core number ranges. For
+                    example, '1-4,7,8,10-12' would mean cores 1 to 4, cores 7, 8, and 10 to 12. Use
+                    the special keyword 'all' to specify all cores"""
+_PKG_LIST_TXT = """The list can include individual package numbers and package number ranges. For
+                   example, '1-3' would mean packages 1 to 3, and '1,3' would mean packages 1 and 3.
+                   Use the special keyword 'all' to specify all packages"""
+_CST_LIST_TXT = """You can specify C-states either by name (e.g., 'C1') or by the index. Use 'all'
+                   to specify all the available C-states (this is the default)"""
+_FREQ_TXT = """The default unit is 'kHz', but 'Hz', 'MHz', and 'GHz' can also be used, for example
+               '900MHz'."""
+_UCFREQ_TXT = """Uncore frequency is per-package, therefore, the '--cpus' and '--cores' options
+                 should not be used with this option."""
+
+# The 'add_argument()' keyword arguments common to all the 'cstates config' feature options. Without
+# an argument, a feature option prints the current value, and it is not in 'args' if not used.
+_FEATURE_BASE_KWARGS = {"default": argparse.SUPPRESS, "nargs": "?"}
 
 class PepcArgsParser(ArgParse.ArgsParser):
     """
@@ -48,29 +75,34 @@ class PepcArgsParser(ArgParse.ArgsParser):
         if not uargs:
             return args
 
-        for opt in ArgParse.SSH_OPTIONS:
-            if opt.short in uargs:
-                optname = opt.short
-            elif opt.long in uargs:
-                optname = opt.long
-            else:
+        unknown = []
+        idx = 0
+        while idx < len(uargs):
+            optname = uargs[idx]
+            opt = _SSH_OPTIONS_MAP.get(optname)
+            if not opt:
+                unknown.append(optname)
+                idx += 1
                 continue
 
-            val_idx = uargs.index(optname) + 1
-            if len(uargs) <= val_idx or uargs[val_idx].startswith("-"):
+            # Do not treat the next option as the value, but allow for negative numbers.
+            val_idx = idx + 1
+            if len(uargs) <= val_idx or \
+               (uargs[val_idx].startswith("-") and not Trivial.is_int(uargs[val_idx])):
                 raise Error(f"value required for argument '{optname}'")
 
             setattr(args, opt.kwargs["dest"], uargs[val_idx])
-            uargs.remove(uargs[val_idx])
-            uargs.remove(optname)
+            idx += 2
 
-        if uargs:
-            raise Error(f"unrecognized option(s): {' '.join(uargs)}")
+        if unknown:
+            raise Error(f"unrecognized option(s): {' '.join(unknown)}")
         return args
 
 def cpu_hotplug_info_command(_, proc):
     """Implements the 'cpu-hotplug info' command."""
 
+    from pepclibs import CPUInfo # pylint: disable=import-outside-toplevel
+
     with CPUInfo.CPUInfo(proc=proc) as cpuinfo:
         cpugeom = cpuinfo.get_cpu_geometry()
 
@@ -81,20 +113,28 @@ def cpu_hotplug_info_command(_, proc):
             LOG.info("The following CPUs are %s%s:", word, proc.hostmsg)
             LOG.info("%s", Human.rangify(cpugeom[key]))
 
+# The 'CPUInfo' methods returning all CPU, core, or package numbers, by scope name.
+_SCOPE_METHODS = {"cpu": "get_cpus", "core": "get_cores", "package": "get_packages"}
+
 def get_scope_msg(proc, cpuinfo, nums, scope="CPU"):
     """
     Helper function to return user friendly string of host information and the CPUs or packages
     listed in 'nums'.
     """
 
-    scopes = ("cpu", "core", "package")
-    if scope.lower() not in scopes:
-        raise Error(f"bad scope '{scope}' use one of following: {', '.join(scopes)}")
+    method_name = _SCOPE_METHODS.get(scope.lower())
+    if not method_name:
+        raise Error(f"bad scope '{scope}' use one of following: {', '.join(_SCOPE_METHODS)}")
 
-    get_method = getattr(cpuinfo, f"get_{scope.lower()}s")
-    all_nums = get_method()
+    if nums in ("all", None):
+        is_all = True
+    else:
+        # Compare the sets only if the lengths match, which is cheaper in the common case of a
+        # subset of numbers.
+        all_nums = getattr(cpuinfo, method_name)()
+        is_all = len(nums) == len(all_nums) and set(nums) == set(all_nums)
 
-    if nums in ("all", None) or nums == all_nums:
+    if is_all:
         scope = f"all {scope}s"
     else:
         scope = f"{scope}(s): {Human.rangify(nums)}"
@@ -107,6 +147,8 @@ def get_cpus(args, proc, default_cpus="all", cpuinfo=None):
     requested, returns 'default_cpus'.
     """
 
+    from pepclibs import CPUInfo # pylint: disable=import-outside-toplevel
+
     close = False
     cpus = []
 
@@ -125,7 +167,7 @@ def get_cpus(args, proc, default_cpus="all", cpuinfo=None):
         if not cpus and default_cpus is not None:
             cpus = cpuinfo.get_cpu_list(default_cpus)
 
-        cpus = Trivial.list_dedup(cpus)
+        cpus = list(dict.fromkeys(cpus))
     finally:
         if close:
             cpuinfo.close()
@@ -135,12 +177,16 @@ def get_cpus(args, proc, default_cpus="all", cpuinfo=None):
 def cpu_hotplug_online_command(args, proc):
     """Implements the 'cpu-hotplug online' command."""
 
+    from pepclibs import CPUOnline # pylint: disable=import-outside-toplevel
+
     with CPUOnline.CPUOnline(progress=logging.INFO, proc=proc) as onl:
         onl.online(cpus=args.cpus)
 
 def cpu_hotplug_offline_command(args, proc):
     """Implements the 'cpu-hotplug offline' command."""
 
+    from pepclibs import CPUInfo, CPUOnline # pylint: disable=import-outside-toplevel
+
     with CPUInfo.CPUInfo(proc=proc) as cpuinfo, \
         CPUOnline.CPUOnline(progress=logging.INFO, proc=proc, cpuinfo=cpuinfo) as onl:
         cpus = get_cpus(args, proc, cpuinfo=cpuinfo)
@@ -150,11 +196,11 @@ def cpu_hotplug_offline_command(args, proc):
             return
 
         cpugeom = cpuinfo.get_cpu_geometry()
-        siblings_to_offline = []
+        siblings_to_offline = set()
         for siblings in cpugeom["cores"].values():
-            siblings_to_offline += siblings[1:]
+            siblings_to_offline.update(siblings[1:])
 
-        siblings_to_offline = set(cpus) & set(siblings_to_offline)
+        siblings_to_offline &= set(cpus)
 
         if not siblings_to_offline:
             LOG.warning("Nothing to offline%s, no siblings among the following CPUs:%s",
@@ -162,36 +208,62 @@ def cpu_hotplug_offline_command(args, proc):
         else:
             onl.offline(cpus=siblings_to_offline)
 
+# The C-state configuration options along with the information keys to print for them, in the order
+# the options are handled.
+_CSTATE_CONFIG_KEYS = {
+    "cstate_prewake" : {"cstate_prewake", "cstate_prewake_supported", "package"},
+    "c1e_autopromote" : {"c1e_autopromote", "package"},
+    "pkg_cstate_limit" : {"pkg_cstate_limit_supported", "pkg_cstate_limit", "pkg_cstate_limits",
+                          "package"},
+    "c1_demotion" : {"c1_demotion", "cpu"},
+    "c1_undemotion" : {"c1_undemotion", "cpu"},
+}
+
+# Same as '_CSTATE_CONFIG_KEYS', but for the P-state configuration options.
+_PSTATE_CONFIG_KEYS = {
+    "epb" : {"epb_supported", "epb_policy", "epb"},
+    "epp" : {"epp_supported", "epp_policy", "epp"},
+    "governor" : {"governor"},
+    "turbo" : {"turbo_supported", "turbo_enabled"},
+}
+
 def cstates_info_command(args, proc):
     """Implements the 'cstates info' command."""
 
+    from pepclibs import CPUIdle # pylint: disable=import-outside-toplevel
+
     cpus = get_cpus(args, proc, default_cpus=0)
 
     first = True
     with CPUIdle.CPUIdle(proc=proc) as cpuidle:
         for info in cpuidle.get_cstates_info(cpus=cpus, cstates=args.cstates):
+            lines = []
             if not first:
-                LOG.info("")
+                lines.append("")
             first = False
 
-            LOG.info("CPU: %d", info["cpu"])
-            LOG.info("Name: %s", info["name"])
-            LOG.info("Index: %d", info["index"])
-            LOG.info("Description: %s", info["desc"])
-            LOG.info("Status: %s", "disabled" if info["disable"] else "enabled")
-            LOG.info("Expected latency: %d μs", info["latency"])
-            LOG.info("Target residency: %d μs", info["residency"])
-            LOG.info("Requested: %d times", info["usage"])
+            lines.append(f"CPU: {info['cpu']}")
+            lines.append(f"Name: {info['name']}")
+            lines.append(f"Index: {info['index']}")
+            lines.append(f"Description: {info['desc']}")
+            lines.append(f"Status: {'disabled' if info['disable'] else 'enabled'}")
+            lines.append(f"Expected latency: {info['latency']} μs")
+            lines.append(f"Target residency: {info['residency']} μs")
+            lines.append(f"Requested: {info['usage']} times")
+            LOG.info("%s", "\n".join(lines))
 
 def cstates_set_command(args, proc):
     """Implements the 'cstates set' command."""
 
+    from pepclibs import CPUIdle, CPUInfo # pylint: disable=import-outside-toplevel
+
     if not getattr(args, "oargs", None):
         raise Error("please, provide the list of C-states to enable or disable")
 
-    cpus = get_cpus(args, proc)
+    with CPUInfo.CPUInfo(proc=proc) as cpuinfo, \
+        CPUIdle.CPUIdle(proc=proc, cpuinfo=cpuinfo) as cpuidle:
+        cpus = get_cpus(args, proc, cpuinfo=cpuinfo)
 
-    with CPUIdle.CPUIdle(proc=proc) as cpuidle:
         for name, cstates in args.oargs:
             method = getattr(cpuidle, f"{name}_cstates")
             cpus, cstates = method(cpus=cpus, cstates=cstates)
@@ -202,13 +274,20 @@ def cstates_set_command(args, proc):
                 msg = "C-state(s) "
                 msg += ", ".join(cstates)
 
-            with CPUInfo.CPUInfo(proc=proc) as cpuinfo:
-                scope = get_scope_msg(proc, cpuinfo, cpus)
+            scope = get_scope_msg(proc, cpuinfo, cpus)
             LOG.info("%sd %s%s", name.title(), msg, scope)
 
+# The on/off C-state configuration keys printed by 'print_cstate_config_options()', along with the
+# scope name and the information key of the CPU or package number.
+_CSTATE_BOOL_KEYS = (("c1e_autopromote", "Package", "package"),
+                     ("c1_demotion", "CPU", "cpu"),
+                     ("c1_undemotion", "CPU", "cpu"))
+
 def print_cstate_config_options(proc, cpuidle, keys, cpus):
     """Print information about options related to C-state, such as C-state prewake."""
 
+    from pepclibs import CPUIdle # pylint: disable=import-outside-toplevel
+
     keys_descr = CPUIdle.CSTATE_KEYS_DESCR
     first = True
 
@@ -227,83 +306,64 @@ def print_cstate_config_options(proc, cpuidle, keys, cpus):
         if info.get("cstate_prewake_supported"):
             enabled =  bool_fmt(info["cstate_prewake"])
             LOG.info("Package %s: %s: %s", info["package"], keys_descr["cstate_prewake"], enabled)
-        if "c1e_autopromote" in info:
-            enabled =  bool_fmt(info["c1e_autopromote"])
-            LOG.info("Package %s: %s: %s", info["package"], keys_descr["c1e_autopromote"], enabled)
-        if "c1_demotion" in info:
-            enabled =  bool_fmt(info["c1_demotion"])
-            LOG.info("CPU %s: %s: %s", info["cpu"], keys_descr["c1_demotion"], enabled)
-        if "c1_undemotion" in info:
-            enabled =  bool_fmt(info["c1_undemotion"])
-            LOG.info("CPU %s: %s: %s", info["cpu"], keys_descr["c1_undemotion"], enabled)
+        for key, what, numkey in _CSTATE_BOOL_KEYS:
+            if key in info:
+                LOG.info("%s %s: %s: %s", what, info[numkey], keys_descr[key], bool_fmt(info[key]))
         first = False
 
+def _get_config_nums(args, proc, cpuinfo, scope):
+    """
+    Returns the '(cpus, nums, info_cpus)' tuple for configuration options of scope 'scope'. The
+    'cpus' element is the list of CPUs to change the option for, 'nums' is the list of CPU or
+    package numbers to mention in the messages, and 'info_cpus' is the list of CPUs to print the
+    current option value for.
+    """
+
+    if scope == "package":
+        pkgs = cpuinfo.get_package_list(args.packages)
+        # Get first CPU number belonging to each package 'args.packages'.
+        pkg_cpus = [cpuinfo.pkgs_to_cpus(pkgs=pkg)[0] for pkg in pkgs]
+        return (cpuinfo.pkgs_to_cpus(pkgs=pkgs), pkgs, pkg_cpus)
+
+    cpus = get_cpus(args, proc, cpuinfo=cpuinfo)
+    return (cpus, cpus, get_cpus(args, proc, default_cpus=0, cpuinfo=cpuinfo))
+
 def handle_cstate_config_options(args, proc, cpuinfo):
     """Handle options related to C-state, such as setting C-state prewake."""
 
-    pkgs = cpuinfo.get_package_list(args.packages)
-    cpus = cpuinfo.pkgs_to_cpus(pkgs=pkgs)
-
-    # Get first CPU number belonging to each package 'args.packages'.
-    pkg_cpus = []
-    for pkg in pkgs:
-        pkg_cpus.append(cpuinfo.pkgs_to_cpus(pkgs=pkg)[0])
-
-    opts = {}
-    if hasattr(args, "cstate_prewake"):
-        opts["cstate_prewake"] = {}
-        opts["cstate_prewake"]["cpus"] = cpus
-        opts["cstate_prewake"]["packages"] = pkgs
-        opts["cstate_prewake"]["info_nums"] = pkg_cpus
-        opts["cstate_prewake"]["keys"] = {"cstate_prewake", "cstate_prewake_supported", "package"}
-        opts["cstate_prewake"]["val"] = getattr(args, "cstate_prewake")
-    if hasattr(args, "c1e_autopromote"):
-        opts["c1e_autopromote"] = {}
-        opts["c1e_autopromote"]["cpus"] = cpus
-        opts["c1e_autopromote"]["packages"] = pkgs
-        opts["c1e_autopromote"]["info_nums"] = pkg_cpus
-        opts["c1e_autopromote"]["keys"] = {"c1e_autopromote", "package"}
-        opts["c1e_autopromote"]["val"] = getattr(args, "c1e_autopromote")
-    if hasattr(args, "pkg_cstate_limit"):
-        opts["pkg_cstate_limit"] = {}
-        opts["pkg_cstate_limit"]["cpus"] = cpus
-        opts["pkg_cstate_limit"]["packages"] = pkgs
-        opts["pkg_cstate_limit"]["info_nums"] = pkg_cpus
-        opts["pkg_cstate_limit"]["keys"] = {"pkg_cstate_limit_supported", "pkg_cstate_limit",
-                                            "pkg_cstate_limits", "package"}
-        opts["pkg_cstate_limit"]["val"] = getattr(args, "pkg_cstate_limit")
-    if hasattr(args, "c1_demotion"):
-        opts["c1_demotion"] = {}
-        opts["c1_demotion"]["cpus"] = get_cpus(args, proc, cpuinfo=cpuinfo)
-        opts["c1_demotion"]["info_nums"] = get_cpus(args, proc, default_cpus=0, cpuinfo=cpuinfo)
-        opts["c1_demotion"]["keys"] = {"c1_demotion", "cpu"}
-        opts["c1_demotion"]["val"] = getattr(args, "c1_demotion")
-    if hasattr(args, "c1_undemotion"):
-        opts["c1_undemotion"] = {}
-        opts["c1_undemotion"]["cpus"] = get_cpus(args, proc, cpuinfo=cpuinfo)
-        opts["c1_undemotion"]["info_nums"] = get_cpus(args, proc, default_cpus=0, cpuinfo=cpuinfo)
-        opts["c1_undemotion"]["keys"] = {"c1_undemotion", "cpu"}
-        opts["c1_undemotion"]["val"] = getattr(args, "c1_undemotion")
+    from pepclibs import CPUIdle # pylint: disable=import-outside-toplevel
+
+    # The CPU numbers for every scope, resolved only once for all options of the same scope.
+    scope_nums = {}
 
     with CPUIdle.CPUIdle(proc=proc, cpuinfo=cpuinfo) as cpuidle:
-        for opt, opt_info in opts.items():
-            if opt_info["val"]:
-                cpuidle.set_feature(opt, opt_info["val"], opt_info["cpus"])
+        for opt, keys in _CSTATE_CONFIG_KEYS.items():
+            if not hasattr(args, opt):
+                continue
+
+            feature = CPUIdle.FEATURES[opt]
+            scope = feature["scope"]
+            if scope not in scope_nums:
+                scope_nums[scope] = _get_config_nums(args, proc, cpuinfo, scope)
+            cpus, nums, info_cpus = scope_nums[scope]
 
-                scope = CPUIdle.FEATURES[opt]["scope"]
-                nums = opt_info.get(f"{scope.lower()}s")
+            val = getattr(args, opt)
+            if val:
+                cpuidle.set_feature(opt, val, cpus)
                 msg = get_scope_msg(proc, cpuinfo, nums, scope=scope)
-                LOG.info("Set %s to '%s'%s", CPUIdle.FEATURES[opt]["name"], opt_info["val"], msg)
+                LOG.info("Set %s to '%s'%s", feature["name"], val, msg)
             else:
-                print_cstate_config_options(proc, cpuidle, opt_info["keys"], opt_info["info_nums"])
+                print_cstate_config_options(proc, cpuidle, keys, info_cpus)
 
 def cstates_config_command(args, proc):
     """Implements the 'cstates config' command."""
 
-    if not any([hasattr(args, opt) for opt in CPUIdle.FEATURES]):
+    from pepclibs import CPUIdle, CPUInfo # pylint: disable=import-outside-toplevel
+
+    if not any(hasattr(args, opt) for opt in CPUIdle.FEATURES):
         raise Error("please, provide a configuration option")
 
-    if any([args.cpus or args.cores]):
+    if args.cpus or args.cores:
         opts = ("cstate_prewake", "c1e_autopromote", "pkg_cstate_limit")
         msg = " and ".join([f"--{opt}" for opt in opts if getattr(args, opt, None)])
         if msg:
@@ -313,23 +373,54 @@ def cstates_config_command(args, proc):
     with CPUInfo.CPUInfo(proc=proc) as cpuinfo:
         handle_cstate_config_options(args, proc, cpuinfo)
 
+# The units used by 'khz_fmt()' and the amount of kHz in each of them.
+_KHZ_UNITS = ("kHz", "MHz", "GHz")
+_KHZ_DIVS = (1, 1000, 1000000)
+
+# The generic cpufreq governors that keep the CPU frequency at one of the limits, along with the
+# other limit, which the governor ignores.
+_STATIC_GOVERNORS = {"performance": "minimum", "powersave": "maximum"}
+
 def khz_fmt(val):
     """
     Convert an integer value representing "kHz" into string. To make it more human-friendly, if
-    'val' is a huge number, convert it into a larger unit, like "MHz" or "GHz".
+    'val' is a huge number, convert it into a larger unit, like "MHz" or "GHz". The result is
+    rounded to 3 decimal places, and whole numbers are printed without the fractional part.
     """
 
-    for unit in ("kHz", "MHz", "GHz"):
-        if val < 1000:
-            break
-        val /= 1000
-    return f"{val}{unit}"
+    idx = 0
+    while val >= _KHZ_DIVS[idx] * 1000 and idx < len(_KHZ_UNITS) - 1:
+        idx += 1
+
+    whole, rem = divmod(val, _KHZ_DIVS[idx])
+    if not rem:
+        return f"{whole}{_KHZ_UNITS[idx]}"
+    # Round to 3 decimal places and drop the trailing zeroes.
+    return f"{val / _KHZ_DIVS[idx]:.3f}".rstrip("0").rstrip(".") + _KHZ_UNITS[idx]
 
 def bool_fmt(val):
     """Convert boolean value to "yes" or "no" string."""
 
     return "yes" if val else "no"
 
+# The 'print_pstates_info()' keys which are printed the same way for every CPU, in the printing
+# order, along with the function formatting the value.
+_PSTATES_INFO_FMT = (("cpu", str),
+                     ("base", khz_fmt),
+                     ("max_eff", khz_fmt),
+                     ("max_turbo", khz_fmt),
+                     ("min_limit", khz_fmt),
+                     ("max_limit", khz_fmt),
+                     ("min", khz_fmt),
+                     ("max", khz_fmt),
+                     ("hwp_supported", bool_fmt),
+                     ("hwp_enabled", bool_fmt),
+                     ("turbo_supported", bool_fmt),
+                     ("turbo_enabled", bool_fmt),
+                     ("driver", str),
+                     ("governor", str),
+                     ("governors", ", ".join))
+
 def check_uncore_options(args):
     """Verify that '--cpus' and '--cores' are not used with uncore commands."""
 
@@ -342,70 +433,50 @@ def check_uncore_options(args):
 def print_pstates_info(proc, cpuinfo, keys=None, cpus="all"):
     """Print CPU P-states information."""
 
+    from pepclibs import CPUFreq # pylint: disable=import-outside-toplevel
+
     keys_decr = CPUFreq.CPUFREQ_KEYS_DESCR
 
     first = True
     with CPUFreq.CPUFreq(proc=proc, cpuinfo=cpuinfo) as pstates:
         for info in pstates.get_cpufreq_info(cpus, keys=keys, fail_on_unsupported=False):
+            lines = []
             if not first:
-                LOG.info("")
+                lines.append("")
             first = False
-            if "cpu" in info:
-                LOG.info("%s: %d", keys_decr["cpu"], info["cpu"])
-            if "base" in info:
-                LOG.info("%s: %s", keys_decr["base"], khz_fmt(info["base"]))
-            if "max_eff" in info:
-                LOG.info("%s: %s", keys_decr["max_eff"], khz_fmt(info["max_eff"]))
-            if "max_turbo" in info:
-                LOG.info("%s: %s", keys_decr["max_turbo"], khz_fmt(info["max_turbo"]))
-            if "min_limit" in info:
-                LOG.info("%s: %s", keys_decr["min_limit"], khz_fmt(info["min_limit"]))
-            if "max_limit" in info:
-                LOG.info("%s: %s", keys_decr["max_limit"], khz_fmt(info["max_limit"]))
-            if "min" in info:
-                LOG.info("%s: %s", keys_decr["min"], khz_fmt(info["min"]))
-            if "max" in info:
-                LOG.info("%s: %s", keys_decr["max"], khz_fmt(info["max"]))
-            if "hwp_supported" in info:
-                LOG.info("%s: %s", keys_decr["hwp_supported"], bool_fmt(info["hwp_supported"]))
-            if "hwp_enabled" in info and info.get("hwp_supported"):
-                LOG.info("%s: %s", keys_decr["hwp_enabled"], bool_fmt(info["hwp_enabled"]))
-            if "turbo_supported" in info:
-                LOG.info("%s: %s", keys_decr["turbo_supported"], bool_fmt(info["turbo_supported"]))
-            if "turbo_enabled" in info and info.get("turbo_supported"):
-                LOG.info("%s: %s", keys_decr["turbo_enabled"], bool_fmt(info["turbo_enabled"]))
-            if "driver" in info:
-                LOG.info("%s: %s", keys_decr["driver"], info["driver"])
-            if "governor" in info:
-                LOG.info("%s: %s", keys_decr["governor"], info["governor"])
-            if "governors" in info:
-                LOG.info("%s: %s", keys_decr["governors"], ", ".join(info["governors"]))
-            if "epp_supported" in info:
-                if not info.get("epp_supported"):
-                    LOG.info("%s: %s", keys_decr["epp_supported"], bool_fmt(info["epp_supported"]))
-                else:
-                    if "epp" in info:
-                        LOG.info("%s: %d", keys_decr["epp"], info["epp"])
-                    if info.get("epp_policy"):
-                        LOG.info("%s: %s", keys_decr["epp_policy"], info["epp_policy"])
-                    if info.get("epp_policies"):
-                        epp_policies_str = ", ".join(info["epp_policies"])
-                        LOG.info("%s: %s", keys_decr["epp_policies"], epp_policies_str)
-            if "epb_supported" in info:
-                if not info.get("epb_supported"):
-                    LOG.info("%s: %s", keys_decr["epb_supported"], bool_fmt(info["epb_supported"]))
-                else:
-                    if "epb" in info:
-                        LOG.info("%s: %d", keys_decr["epb"], info["epb"])
-                    if info.get("epb_policy"):
-                        LOG.info("%s: %s", keys_decr["epb_policy"], info["epb_policy"])
-                    if info.get("epb_policies"):
-                        epb_policies_str = ", ".join(info["epb_policies"])
-                        LOG.info("%s: %s", keys_decr["epb_policies"], epb_policies_str)
+
+            for key, fmt in _PSTATES_INFO_FMT:
+                if key not in info:
+                    continue
+                # Only print whether a feature is enabled if it is supported.
+                supported_key = key.replace("_enabled", "_supported")
+                if supported_key != key and not info.get(supported_key):
+                    continue
+                lines.append(f"{keys_decr[key]}: {fmt(info[key])}")
+
+            for pfx in ("epp", "epb"):
+                if f"{pfx}_supported" not in info:
+                    continue
+                if not info.get(f"{pfx}_supported"):
+                    lines.append(f"{keys_decr[pfx + '_supported']}: "
+                                 f"{bool_fmt(info[pfx + '_supported'])}")
+                    continue
+                if pfx in info:
+                    lines.append(f"{keys_decr[pfx]}: {info[pfx]}")
+                if info.get(f"{pfx}_policy"):
+                    lines.append(f"{keys_decr[pfx + '_policy']}: {info[pfx + '_policy']}")
+                if info.get(f"{pfx}_policies"):
+                    policies_str = ", ".join(info[f"{pfx}_policies"])
+                    lines.append(f"{keys_decr[pfx + '_policies']}: {policies_str}")
+
+            if lines:
+                LOG.info("%s", "\n".join(lines))
 
 def print_uncore_info(args, proc):
     """Print uncore frequency information."""
 
+    from pepclibs import CPUFreq # pylint: disable=import-outside-toplevel
+
     check_uncore_options(args)
     keys_decr = CPUFreq.UNCORE_KEYS_DESCR
 
@@ -426,6 +497,8 @@ def print_uncore_info(args, proc):
 def pstates_info_command(args, proc):
     """Implements the 'pstates info' command."""
 
+    from pepclibs import CPUInfo # pylint: disable=import-outside-toplevel
+
     if args.uncore:
         print_uncore_info(args, proc)
     else:
@@ -433,16 +506,46 @@ def pstates_info_command(args, proc):
             cpus = get_cpus(args, proc, default_cpus=0, cpuinfo=cpuinfo)
             print_pstates_info(proc, cpuinfo, cpus=cpus)
 
+def warn_static_governors(proc, pstates, cpus, minfreq, maxfreq):
+    """
+    Warn if CPUs in 'cpus' use a governor that keeps the CPU frequency at one of the limits, and the
+    other limit is being changed ('minfreq' or 'maxfreq' is set), which has no visible effect.
+    """
+
+    limits = set()
+    if minfreq:
+        limits.add("minimum")
+    if maxfreq:
+        limits.add("maximum")
+
+    static_govs = {gov: limit for gov, limit in _STATIC_GOVERNORS.items() if limit in limits}
+    if not static_govs:
+        return
+
+    govs = {}
+    for info in pstates.get_cpufreq_info(cpus, keys=("cpu", "driver", "governor")):
+        if info["driver"] == "intel_pstate":
+            # The 'intel_pstate' governors scale the frequency dynamically.
+            return
+        govs.setdefault(info["governor"], []).append(info["cpu"])
+
+    for gov, limit in static_govs.items():
+        if gov in govs:
+            LOG.warning("CPU frequency governor%s is '%s' for CPU(s) %s, it ignores the %s CPU "
+                        "frequency limit", proc.hostmsg, gov, Human.rangify(govs[gov]), limit)
+
 def pstates_set_command(args, proc):
     """Implements the 'pstates set' command."""
 
-    if not any([args.minfreq, args.maxfreq, args.maxufreq, args.minufreq]):
+    from pepclibs import CPUFreq, CPUInfo # pylint: disable=import-outside-toplevel
+
+    if not (args.minfreq or args.maxfreq or args.maxufreq or args.minufreq):
         raise Error("please, specify a frequency to change")
 
-    if any((args.minfreq, args.maxfreq)) and any((args.maxufreq, args.minufreq)):
+    if (args.minfreq or args.maxfreq) and (args.maxufreq or args.minufreq):
         raise Error("CPU and uncore frequency options are mutually exclusive")
 
-    if any((args.maxufreq, args.minufreq)):
+    if args.maxufreq or args.minufreq:
         check_uncore_options(args)
 
     with CPUInfo.CPUInfo(proc=proc) as cpuinfo, \
@@ -450,6 +553,7 @@ def pstates_set_command(args, proc):
         cpus = get_cpus(args, proc, cpuinfo=cpuinfo)
 
         if args.minfreq or args.maxfreq:
+            warn_static_governors(proc, pstates, cpus, args.minfreq, args.maxfreq)
             msg = "Set CPU "
             nums, minfreq, maxfreq = pstates.set_freq(args.minfreq, args.maxfreq, cpus)
             scope = pstates.get_scope("cpu-freq")
@@ -471,49 +575,38 @@ def pstates_set_command(args, proc):
 def handle_pstate_config_options(args, proc, cpuinfo):
     """Handle options related to P-state, such as getting or setting EPP or turbo value."""
 
+    from pepclibs import CPUFreq # pylint: disable=import-outside-toplevel
+
+    cpus = info_cpus = None
+
     with CPUFreq.CPUFreq(proc=proc, cpuinfo=cpuinfo) as pstates:
-        opts = {}
+        for opt, keys in _PSTATE_CONFIG_KEYS.items():
+            if not hasattr(args, opt):
+                continue
 
-        cpus = get_cpus(args, proc, cpuinfo=cpuinfo)
-        if hasattr(args, "epb"):
-            opts["epb"] = {}
-            opts["epb"]["keys"] = {"epb_supported", "epb_policy", "epb"}
-            opts["epb"]["val"] = getattr(args, "epb", None)
-            scope = pstates.get_scope("epb")
-            opts["epb"]["scope"] = get_scope_msg(proc, cpuinfo, cpus, scope=scope)
-        if hasattr(args, "epp"):
-            opts["epp"] = {}
-            opts["epp"]["keys"] = {"epp_supported", "epp_policy", "epp"}
-            opts["epp"]["val"] = getattr(args, "epp", None)
-            scope = pstates.get_scope("epp")
-            opts["epp"]["scope"] = get_scope_msg(proc, cpuinfo, cpus, scope=scope)
-        if hasattr(args, "governor"):
-            opts["governor"] = {}
-            opts["governor"]["keys"] = {"governor"}
-            opts["governor"]["val"] = getattr(args, "governor", None)
-            scope = pstates.get_scope("governor")
-            opts["governor"]["scope"] = scope
-            opts["governor"]["scope"] = get_scope_msg(proc, cpuinfo, cpus, scope=scope)
-        if hasattr(args, "turbo"):
-            opts["turbo"] = {}
-            opts["turbo"]["keys"] = {"turbo_supported", "turbo_enabled"}
-            opts["turbo"]["val"] = getattr(args, "turbo", None)
-            opts["turbo"]["scope"] = f"{proc.hostmsg} for all CPUs"
-
-        for opt, opt_info in opts.items():
-            if opt_info["val"] is not None:
-                pstates.set_feature(opt, opt_info["val"], cpus=cpus)
-                LOG.info("Set %s to '%s'%s", opt, opt_info["val"], opt_info["scope"])
+            val = getattr(args, opt)
+            if val is not None:
+                if cpus is None:
+                    cpus = get_cpus(args, proc, cpuinfo=cpuinfo)
+                pstates.set_feature(opt, val, cpus=cpus)
+
+                scope = pstates.get_scope(opt)
+                if scope == "global":
+                    msg = f"{proc.hostmsg} for all CPUs"
+                else:
+                    msg = get_scope_msg(proc, cpuinfo, cpus, scope=scope)
+                LOG.info("Set %s to '%s'%s", opt, val, msg)
             else:
-                cpus = get_cpus(args, proc, default_cpus=0, cpuinfo=cpuinfo)
-                opt_info["keys"].add("cpu")
-                print_pstates_info(proc, cpuinfo, keys=opt_info["keys"], cpus=cpus)
+                if info_cpus is None:
+                    info_cpus = get_cpus(args, proc, default_cpus=0, cpuinfo=cpuinfo)
+                print_pstates_info(proc, cpuinfo, keys=keys | {"cpu"}, cpus=info_cpus)
 
 def pstates_config_command(args, proc):
     """Implements the 'pstates config' command."""
 
-    if not any((hasattr(args, "governor"), hasattr(args, "turbo"), hasattr(args, "epb"),
-                hasattr(args, "epp"))):
+    from pepclibs import CPUInfo # pylint: disable=import-outside-toplevel
+
+    if not any(hasattr(args, opt) for opt in _PSTATE_CONFIG_KEYS):
         raise Error("please, provide a configuration option")
 
     with CPUInfo.CPUInfo(proc=proc) as cpuinfo:
@@ -527,6 +620,8 @@ def pstates_config_command(args, proc):
 def aspm_info_command(_, proc):
     """Implements the 'aspm info'. command"""
 
+    from pepclibs import ASPM # pylint: disable=import-outside-toplevel
+
     with ASPM.ASPM(proc=proc) as aspm:
         cur_policy = aspm.get_policy()
         LOG.info("Active ASPM policy%s: %s", proc.hostmsg, cur_policy)
@@ -536,6 +631,8 @@ def aspm_info_command(_, proc):
 def aspm_set_command(args, proc):
     """Implements the 'aspm set' command."""
 
+    from pepclibs import ASPM # pylint: disable=import-outside-toplevel
+
     with ASPM.ASPM(proc=proc) as aspm:
         old_policy = aspm.get_policy()
         if not args.policy:
@@ -553,39 +650,52 @@ def aspm_set_command(args, proc):
             LOG.info("ASPM policy%s was changed from '%s' to '%s'",
                      proc.hostmsg, old_policy, args.policy)
 
-def build_arguments_parser():
-    """A helper function which parses the input arguments."""
+def _add_cpus_options(subpars, what):
+    """
+    Add the '--cpus', '--cores', and '--packages' options to the 'subpars' sub-command parser. The
+    'what' argument describes what the CPUs are selected for, e.g., "configure".
+    """
 
-    cpu_list_txt = """The list can include individual CPU numbers and CPU number ranges. For
-                      example, '1-4,7,8,10-12' would mean CPUs 1 to 4, CPUs 7, 8, and 10 to 12.
-                      Use the special keyword 'all' to specify all CPUs"""
-    core_list_txt = """The list can include individual core numbers and core number ranges. For
-                       example, '1-4,7,8,10-12' would mean cores 1 to 4, cores 7, 8, and 10 to 12.
-                       Use the special keyword 'all' to specify all cores"""
-    pkg_list_txt = """The list can include individual package numbers and package number ranges. For
-                      example, '1-3' would mean packages 1 to 3, and '1,3' would mean packages 1 and
-                      3. Use the special keyword 'all' to specify all packages"""
+    text = f"""List of CPUs to {what}. {_CPU_LIST_TXT}."""
+    subpars.add_argument("--cpus", help=text)
 
-    # We rename destination variables for the '--package', '--core', and '--cpu' options in some
-    # cases in order to make them match level names used in the 'CPUInfo' module. See
-    # 'CPUInfo.LEVELS'.
+    text = f"""List of cores to {what}. {_CORE_LIST_TXT}."""
+    subpars.add_argument("--cores", help=text)
 
-    text = "pepc - Power, Energy, and Performance Configuration tool for Linux."
-    parser = PepcArgsParser(description=text, prog=OWN_NAME, ver=VERSION)
+    text = f"""List of packages to {what}. {_PKG_LIST_TXT}."""
+    subpars.add_argument("--packages", help=text)
 
-    ArgParse.add_ssh_options(parser)
+def _get_feature_opts(features):
+    """
+    Yield the '(option, kwargs)' tuples for the 'cstates config' command options corresponding to
+    features in the 'features' dictionary (e.g., 'CPUIdle.FEATURES'). The 'kwargs' dictionary
+    contains keyword arguments for 'add_argument()'.
+    """
 
-    text = "Force coloring of the text output."
-    parser.add_argument("--force-color", action="store_true", help=text)
-    subparsers = parser.add_subparsers(title="commands", metavar="")
-    subparsers.required = True
+    for name, info in features.items():
+        option = f"--{name.replace('_', '-')}"
+        extra_kwargs = {}
+
+        # Only the binary "on/off" type features have the "enabled" key.
+        if "enabled" in info:
+            text = "Enable or disable "
+            extra_kwargs["choices"] = info["choices"]
+            choices = " or ".join([f"\"{val}\"" for val in info["choices"]])
+            choices = f" Use {choices}."
+        else:
+            text = "Set "
+            choices = ""
+
+        text += f"""{info["name"]} (applicaple only to Intel CPU). {info["help"]}{choices}
+                    {info["name"]} setting has {info["scope"]} scope. By default this option
+                    applies to all {info["scope"]}s. If you do not pass any argument to
+                    "{option}", it will print the current values."""
+
+        yield option, {**_FEATURE_BASE_KWARGS, **extra_kwargs, "help": text}
+
+def _build_cpu_hotplug_parser(subpars):
+    """Build the sub-commands of the 'cpu-hotplug' command."""
 
-    #
-    # Create parser for the 'cpu-hotplug' command.
-    #
-    text = "CPU online/offline commands."
-    descr = """CPU online/offline commands."""
-    subpars = subparsers.add_parser("cpu-hotplug", help=text, description=descr)
     subparsers2 = subpars.add_subparsers(title="further sub-commands", metavar="")
 
     #
@@ -602,7 +712,7 @@ def build_arguments_parser():
     subpars2 = subparsers2.add_parser("online", help=text, description=text)
     subpars2.set_defaults(func=cpu_hotplug_online_command)
 
-    text = f"""List of CPUs to online. {cpu_list_txt}."""
+    text = f"""List of CPUs to online. {_CPU_LIST_TXT}."""
     subpars2.add_argument("--cpus", help=text)
 
     #
@@ -612,7 +722,7 @@ def build_arguments_parser():
     subpars2 = subparsers2.add_parser("offline", help=text, description=text)
     subpars2.set_defaults(func=cpu_hotplug_offline_command)
 
-    text = f"""List of CPUs to offline. {cpu_list_txt}."""
+    text = f"""List of CPUs to offline. {_CPU_LIST_TXT}."""
     subpars2.add_argument("--cpus", help=text)
     text = """Same as '--cpus', but specifies list of cores."""
     subpars2.add_argument("--cores", help=text)
@@ -625,16 +735,11 @@ def build_arguments_parser():
               each group of CPUs belonging to the same core."""
     subpars2.add_argument("--siblings", action="store_true", help=text)
 
-    #
-    # Create parser for the 'cstates' command.
-    #
-    text = "CPU C-state commands."
-    descr = """Various commands related to CPU C-states."""
-    subpars = subparsers.add_parser("cstates", help=text, description=descr)
+def _build_cstates_parser(subpars):
+    """Build the sub-commands of the 'cstates' command."""
+
     subparsers2 = subpars.add_subparsers(title="further sub-commands", metavar="")
 
-    cst_list_text = """You can specify C-states either by name (e.g., 'C1') or by the index. Use
-                      'all' to specify all the available C-states (this is the default)"""
     #
     # Create parser for the 'cstates info' command.
     #
@@ -646,17 +751,10 @@ def build_arguments_parser():
     subpars2.set_defaults(func=cstates_info_command)
 
     text = f"""Comma-sepatated list of C-states to get information about (all C-states by default).
-               {cst_list_text}."""
+               {_CST_LIST_TXT}."""
     subpars2.add_argument("--cstates", help=text)
 
-    text = f"""List of CPUs to get information about. {cpu_list_txt}."""
-    subpars2.add_argument("--cpus", help=text)
-
-    text = f"""List of cores to get information about. {core_list_txt}."""
-    subpars2.add_argument("--cores", help=text)
-
-    text = f"""List of packages to get information about. {pkg_list_txt}."""
-    subpars2.add_argument("--packages", help=text)
+    _add_cpus_options(subpars2, "get information about")
 
     #
     # Create parser for the 'cstates set' command.
@@ -668,20 +766,13 @@ def build_arguments_parser():
     subpars2 = subparsers2.add_parser("set", help=text, description=descr)
     subpars2.set_defaults(func=cstates_set_command)
 
-    text = f"""Comma-sepatated list of C-states to enable (all by default). {cst_list_text}."""
+    text = f"""Comma-sepatated list of C-states to enable (all by default). {_CST_LIST_TXT}."""
     subpars2.add_argument("--enable", action=ArgParse.OrderedArg, help=text)
 
     text = """Similar to '--enable', but specifies the list of C-states to disable."""
     subpars2.add_argument("--disable", action=ArgParse.OrderedArg, help=text)
 
-    text = f"""List of CPUs to enable the specified C-states on. {cpu_list_txt}."""
-    subpars2.add_argument("--cpus", help=text)
-
-    text = f"""List of cores to enable the specified C-states on. {core_list_txt}."""
-    subpars2.add_argument("--cores", help=text)
-
-    text = f"""List of packages to enable the specified C-states on. {pkg_list_txt}."""
-    subpars2.add_argument("--packages", help=text)
+    _add_cpus_options(subpars2, "enable the specified C-states on")
 
     #
     # Create parser for the 'cstates config' command.
@@ -690,45 +781,18 @@ def build_arguments_parser():
     subpars2 = subparsers2.add_parser("config", help=text, description=text)
     subpars2.set_defaults(func=cstates_config_command)
 
-    text = f"""List of CPUs to configure. {cpu_list_txt}."""
-    subpars2.add_argument("--cpus", help=text)
-
-    text = f"""List of cores to configure. {core_list_txt}."""
-    subpars2.add_argument("--cores", help=text)
-
-    text = f"""List of packages to configure. {pkg_list_txt}."""
-    subpars2.add_argument("--packages", help=text)
-
-    for name, info in CPUIdle.FEATURES.items():
-        kwargs = {}
-        kwargs["default"] = argparse.SUPPRESS
-        kwargs["nargs"] = "?"
-
-        # Only the binary "on/off" type features have the "enabled" key.
-        if "enabled" in info:
-            text = "Enable or disable "
-            kwargs["choices"] = info["choices"]
-            choices = " or ".join([f"\"{val}\"" for val in info["choices"]])
-            choices = f" Use {choices}."
-        else:
-            text = "Set "
-            choices = ""
+    _add_cpus_options(subpars2, "configure")
 
-        option = f"--{name.replace('_', '-')}"
-        text += f"""{info["name"]} (applicaple only to Intel CPU). {info["help"]}{choices}
-                    {info["name"]} setting has {info["scope"]} scope. By default this option
-                    applies to all {info["scope"]}s. If you do not pass any argument to
-                    "{option}", it will print the current values."""
+    # The C-state features are defined in the MSR modules, import them only when building the
+    # parser, not when 'pepc' is imported.
+    from pepclibs import CPUIdle # pylint: disable=import-outside-toplevel
 
-        kwargs["help"] = text
+    for option, kwargs in _get_feature_opts(CPUIdle.FEATURES):
         subpars2.add_argument(option, **kwargs)
 
-    #
-    # Create parser for the 'pstates' command.
-    #
-    text = "P-state commands."
-    descr = """Various commands related to P-states (CPU performance states)."""
-    subpars = subparsers.add_parser("pstates", help=text, description=descr)
+def _build_pstates_parser(subpars):
+    """Build the sub-commands of the 'pstates' command."""
+
     subparsers2 = subpars.add_subparsers(title="further sub-commands", metavar="")
 
     #
@@ -739,21 +803,12 @@ def build_arguments_parser():
     subpars2 = subparsers2.add_parser("info", help=text, description=descr)
     subpars2.set_defaults(func=pstates_info_command)
 
-    text = f"""List of CPUs to get information about. {cpu_list_txt}."""
-    subpars2.add_argument("--cpus", help=text)
-
-    text = f"""List of cores to get information about. {core_list_txt}."""
-    subpars2.add_argument("--cores", help=text)
-
-    text = f"""List of packages to get information about. {pkg_list_txt}."""
-    subpars2.add_argument("--packages", help=text)
+    _add_cpus_options(subpars2, "get information about")
 
-    ucfreq_txt = """Uncore frequency is per-package, therefore, the '--cpus' and '--cores' options
-                    should not be used with this option."""
     text = f"""By default this command provides CPU (core) frequency (P-state) information, but if
                this option is used, it will provide uncore frequency information instead. The uncore
                includes the interconnect between the cores, the shared cache, and other resources
-               shared between the cores. {ucfreq_txt}"""
+               shared between the cores. {_UCFREQ_TXT}"""
     subpars2.add_argument("--uncore", dest="uncore", action="store_true", help=text)
 
     #
@@ -765,18 +820,9 @@ def build_arguments_parser():
     subpars2 = subparsers2.add_parser("set", help=text, description=descr)
     subpars2.set_defaults(func=pstates_set_command)
 
-    text = f"""List of CPUs to set frequencies for. {cpu_list_txt}."""
-    subpars2.add_argument("--cpus", help=text)
-
-    text = f"""List of cores to set frequencies for. {core_list_txt}."""
-    subpars2.add_argument("--cores", help=text)
-
-    text = f"""List of packages to set frequencies for. {pkg_list_txt}."""
-    subpars2.add_argument("--packages", help=text)
+    _add_cpus_options(subpars2, "set frequencies for")
 
-    freq_txt = """The default unit is 'kHz', but 'Hz', 'MHz', and 'GHz' can also be used, for
-                  example '900MHz'."""
-    text = f"""Set minimum CPU frequency. {freq_txt} Additionally, one of the following specifiers
+    text = f"""Set minimum CPU frequency. {_FREQ_TXT} Additionally, one of the following specifiers
                can be used: min,lfm - minimum supported frequency (LFM), eff - maximum effeciency
                frequency, base,hfm - base frequency (HFM), max - maximum supported frequency."""
     subpars2.add_argument("--min-freq", dest="minfreq", help=text)
@@ -784,9 +830,9 @@ def build_arguments_parser():
     text = """Same as '--min-freq', but for maximum CPU frequency."""
     subpars2.add_argument("--max-freq", dest="maxfreq", help=text)
 
-    text = f"""Set minimum uncore frequency. {freq_txt} Additionally, one of the following
+    text = f"""Set minimum uncore frequency. {_FREQ_TXT} Additionally, one of the following
                specifiers can be used: 'min' - the minimum supported uncore frequency, 'max' - the
-               maximum supported uncore frequency. {ucfreq_txt}"""
+               maximum supported uncore frequency. {_UCFREQ_TXT}"""
     subpars2.add_argument("--min-uncore-freq", dest="minufreq", help=text)
 
     text = """Same as '--min-uncore-freq', but for maximum uncore frequency."""
@@ -800,14 +846,7 @@ def build_arguments_parser():
     subpars2 = subparsers2.add_parser("config", help=text, description=descr)
     subpars2.set_defaults(func=pstates_config_command)
 
-    text = f"""List of CPUs to configure P-States on. {cpu_list_txt}."""
-    subpars2.add_argument("--cpus", help=text)
-
-    text = f"""List of cores to configure P-States on. {core_list_txt}."""
-    subpars2.add_argument("--cores", help=text)
-
-    text = f"""List of packages to configure P-States on. {pkg_list_txt}."""
-    subpars2.add_argument("--packages", help=text)
+    _add_cpus_options(subpars2, "configure P-States on")
 
     text = """Set energy performance bias hint. Hint can be integer in range of [0,15]. By default
               this option applies to all CPUs."""
@@ -824,12 +863,9 @@ def build_arguments_parser():
     subpars2.add_argument("--turbo", default=argparse.SUPPRESS, nargs="?", choices=["on", "off"],
                           help=text)
 
-    #
-    # Create parser for the 'aspm' command.
-    #
-    text = "PCI ASPM commands."
-    descr = """Manage Active State Power Management configuration."""
-    subpars = subparsers.add_parser("aspm", help=text, description=descr)
+def _build_aspm_parser(subpars):
+    """Build the sub-commands of the 'aspm' command."""
+
     subparsers2 = subpars.add_subparsers(title="further sub-commands", metavar="")
 
     text = "Get PCI ASPM information."
@@ -845,32 +881,168 @@ def build_arguments_parser():
                value."""
     subpars2.add_argument("--policy", nargs="?", help=text)
 
-    if argcomplete:
-        argcomplete.autocomplete(parser)
+def build_arguments_parser(cmds=None):
+    """
+    Build and return the arguments parser. The 'cmds' argument is a collection of command names
+    (e.g., "cstates") to build the sub-commands for. Other commands are only registered, but their
+    sub-commands and options are not built. By default, everything is built.
+    """
+
+    # We rename destination variables for the '--package', '--core', and '--cpu' options in some
+    # cases in order to make them match level names used in the 'CPUInfo' module. See
+    # 'CPUInfo.LEVELS'.
+
+    text = "pepc - Power, Energy, and Performance Configuration tool for Linux."
+    parser = PepcArgsParser(description=text, prog=OWN_NAME, ver=VERSION)
+
+    ArgParse.add_ssh_options(parser)
+
+    text = "Force coloring of the text output."
+    parser.add_argument("--force-color", action="store_true", help=text)
+    subparsers = parser.add_subparsers(title="commands", metavar="")
+    subparsers.required = True
+
+    #
+    # Create parser for the 'cpu-hotplug' command.
+    #
+    text = "CPU online/offline commands."
+    descr = """CPU online/offline commands."""
+    subpars = subparsers.add_parser("cpu-hotplug", help=text, description=descr)
+    if cmds is None or "cpu-hotplug" in cmds:
+        _build_cpu_hotplug_parser(subpars)
+
+    #
+    # Create parser for the 'cstates' command.
+    #
+    text = "CPU C-state commands."
+    descr = """Various commands related to CPU C-states."""
+    subpars = subparsers.add_parser("cstates", help=text, description=descr)
+    if cmds is None or "cstates" in cmds:
+        _build_cstates_parser(subpars)
+
+    #
+    # Create parser for the 'pstates' command.
+    #
+    text = "P-state commands."
+    descr = """Various commands related to P-states (CPU performance states)."""
+    subpars = subparsers.add_parser("pstates", help=text, description=descr)
+    if cmds is None or "pstates" in cmds:
+        _build_pstates_parser(subpars)
+
+    #
+    # Create parser for the 'aspm' command.
+    #
+    text = "PCI ASPM commands."
+    descr = """Manage Active State Power Management configuration."""
+    subpars = subparsers.add_parser("aspm", help=text, description=descr)
+    if cmds is None or "aspm" in cmds:
+        _build_aspm_parser(subpars)
+
+    # Tab completion is requested by the shell via the '_ARGCOMPLETE' environment variable, so
+    # import 'argcomplete' only in this case.
+    if "_ARGCOMPLETE" in os.environ:
+        try:
+            import argcomplete # pylint: disable=import-outside-toplevel
+        except ImportError:
+            # We can live without argcomplete, we only lose tab completions.
+            argcomplete = None
+        if argcomplete:
+            argcomplete.autocomplete(parser)
 
     return parser
 
+def _get_ssh_option(arg):
+    """
+    Return the 'ArgParse.SSH_OPTIONS' element for the 'arg' command-line argument, or 'None' if it
+    is not an SSH option. Like 'argparse', accept unique prefixes of the long option names.
+    """
+
+    opt = _SSH_OPTIONS_MAP.get(arg)
+    if opt or not arg.startswith("--") or "=" in arg:
+        return opt
+
+    opts = [opt for name, opt in _SSH_OPTIONS_MAP.items() if name.startswith(arg)]
+    if len(opts) == 1:
+        return opts[0]
+    return None
+
+def _get_cmd_name(argv):
+    """
+    Return name of the command in the 'argv' list of command-line arguments, or 'None' if there is
+    no command.
+    """
+
+    idx = 0
+    while idx < len(argv):
+        arg = argv[idx]
+        if _get_ssh_option(arg):
+            # Skip the SSH option value, which may look like a command name.
+            idx += 2
+        elif arg.startswith("-"):
+            idx += 1
+        else:
+            return arg
+
+    return None
+
 def parse_arguments():
     """Parse input arguments."""
 
-    parser = build_arguments_parser()
+    # Only one command runs, so build only its sub-commands. The exceptions are tab completion,
+    # which needs the entire parser, and a command name which is not a known command (e.g., it may
+    # be a value of an option), in which case everything is built and 'argparse' sorts it out.
+    cmds = None
+    if "_ARGCOMPLETE" not in os.environ:
+        cmd = _get_cmd_name(sys.argv[1:])
+        if not cmd:
+            cmds = ()
+        elif cmd in _COMMANDS:
+            cmds = (cmd,)
+
+    parser = _PARSERS.get(cmds)
+    if not parser:
+        parser = _PARSERS[cmds] = build_arguments_parser(cmds=cmds)
     args = parser.parse_args()
 
     return args
 
+def _get_local_proc(_):
+    """Create and return a 'Proc' object for running commands on the local host."""
+
+    from pepclibs.helperlibs import Procs # pylint: disable=import-outside-toplevel
+
+    return Procs.Proc()
+
+def _get_ssh_proc(args):
+    """Create and return an 'SSH' object for running commands on the 'args.hostname' host."""
+
+    # The 'SSH' module pulls in 'paramiko', which is the slowest import of all, so import it only
+    # when a remote host is actually used.
+    from pepclibs.helperlibs import SSH # pylint: disable=import-outside-toplevel
+
+    return SSH.SSH(hostname=args.hostname, username=args.username, privkeypath=args.privkey,
+                   timeout=args.timeout)
+
+# The functions creating the "proc" object for a host name. Any other host name is a remote host
+# and gets an 'SSH' object (see '_get_ssh_proc()').
+_PROC_FACTORIES = {"localhost": _get_local_proc}
+
 def get_proc(args):
     """Returns and "SSH" object or the 'Procs' object depending on 'hostname'."""
 
-    if args.hostname == "localhost":
-        proc = Procs.Proc()
-    else:
-        proc = SSH.SSH(hostname=args.hostname, username=args.username, privkeypath=args.privkey,
-                       timeout=args.timeout)
-    return proc
+    factory = _PROC_FACTORIES.get(args.hostname, _get_ssh_proc)
+    return factory(args)
 
 def main():
     """Script entry point."""
 
+    Logging.setup_logger(prefix=OWN_NAME)
+
+    # Printing the version is common enough and does not need the arguments parser.
+    if sys.argv[1:] == ["--version"]:
+        LOG.info(VERSION)
+        return 0
+
     args = parse_arguments()
 
     if not getattr(args, "func", None):
@@ -10,20 +10,27 @@
 
 """Common bits for the 'pepc' tests."""
 
+import io
 import re
 import sys
+import copy
 import random
-from contextlib import contextmanager
+import functools
+from contextlib import contextmanager, ExitStack
 from unittest.mock import patch, mock_open
 from pathlib import Path
 from pepclibs import CPUInfo
-from pepclibs.helperlibs import Procs, FSHelpers
+from pepclibs.helperlibs import Procs, FSHelpers, Human
+from pepclibs.helperlibs.Exceptions import Error
 from pepclibs.msr import MSR, PCStateConfigCtl
 from pepclibs import pepc
 
+@functools.lru_cache(maxsize=None)
 def _get_mocked_data():
     """
-    Get mocked data for testing purposes. The files with testdata can be opened only before mocking.
+    Get mocked data for testing purposes. The data are read on the first call, and cached for
+    subsequent calls. The files are opened with 'io.open()', which is not replaced when tests mock
+    'builtins.open'.
     Returns dictionary with following keys:
       * cstates - C-state info, similar to output of 'run_verify()' call from
                   'CPUIdle.get_cstates_info()'.
@@ -33,32 +40,101 @@ def _get_mocked_data():
 
     mock_data = {}
     basepath = Path(__file__).parents[1].resolve()
-    with open(basepath / "tests" / "data" / "cstates_info.txt", "r") as fobj:
+    with io.open(basepath / "tests" / "data" / "cstates_info.txt", "r") as fobj:
         mock_data['cstates'] = fobj.readlines()
 
-    with open(basepath / "tests" / "data" / "lscpu_info.txt", "r") as fobj:
+    with io.open(basepath / "tests" / "data" / "lscpu_info.txt", "r") as fobj:
         mock_data['lscpu'] = fobj.readlines()
 
-    with open(basepath / "tests" / "data" / "lscpu_info_cpus.txt", "r") as fobj:
+    with io.open(basepath / "tests" / "data" / "lscpu_info_cpus.txt", "r") as fobj:
         mock_data['lscpu_cpus'] = fobj.readlines()
 
     return mock_data
 
+@functools.lru_cache(maxsize=None)
 def _get_mocked_files():
     """
     Get mocked files for testing purposes. Returns dictionary with file path as key and file content
-    as value.
+    as value. The dictionary is built on the first call, and cached for subsequent calls.
     """
 
+    lines = _get_mocked_data()['cstates']
+    mock_data = {path: val.strip() for path, _, val in (line.partition(":") for line in lines)}
+    mock_data.update(_get_mocked_topology_files())
+    return mock_data
+
+def _get_mocked_topology_files():
+    """
+    Get mocked sysfs CPU topology files, which are generated from the 'lscpu' output used for
+    testing. Returns dictionary with file path as key and file content as value.
+    """
+
+    cpubase = "/sys/devices/system/cpu"
+    nodebase = "/sys/devices/system/node"
+
     mock_data = {}
-    for line in _MOCKED_DATA['cstates']:
-        split = line.split(":")
-        mock_data[split[0]] = split[1].strip()
+    cpus = []
+    online = []
+    nodes = {}
+    pkgs = {}
+    cores = {}
+    for line in _get_mocked_data()['lscpu_cpus']:
+        if line.startswith("#"):
+            continue
+
+        pkg, node, core, cpu, state = line.strip().split(",")
+        cpus.append(int(cpu))
+        if state != "Y":
+            continue
+
+        online.append(int(cpu))
+        nodes.setdefault(int(node), []).append(int(cpu))
+        pkgs.setdefault(int(pkg), []).append(int(cpu))
+        cores.setdefault(int(core), []).append(int(cpu))
+
+    for pkg, pkg_cpus in pkgs.items():
+        for cpu in pkg_cpus:
+            mock_data[f"{cpubase}/cpu{cpu}/topology/physical_package_id"] = str(pkg)
+            mock_data[f"{cpubase}/cpu{cpu}/topology/core_siblings_list"] = Human.rangify(pkg_cpus)
+    for core_cpus in cores.values():
+        for cpu in core_cpus:
+            mock_data[f"{cpubase}/cpu{cpu}/topology/thread_siblings_list"] = \
+                Human.rangify(core_cpus)
+
+    mock_data[f"{cpubase}/present"] = Human.rangify(cpus)
+    mock_data[f"{cpubase}/online"] = Human.rangify(online)
+    mock_data[f"{nodebase}/online"] = Human.rangify(nodes)
+    for node, node_cpus in nodes.items():
+        mock_data[f"{nodebase}/node{node}/cpulist"] = Human.rangify(node_cpus)
 
     return mock_data
 
-_MOCKED_DATA = _get_mocked_data()
-_MOCKED_FILES = _get_mocked_files()
+@functools.lru_cache(maxsize=None)
+def _get_mocked_dirs():
+    """
+    Get directories containing the mocked files. Returns dictionary with directory path as key and
+    directory entries as value. Directory entries are represented by a dictionary with entry name
+    as key and file type indicator (same as in 'lsdir()') as value.
+    """
+
+    dirs = {}
+    for m_path in _get_mocked_files():
+        parts = m_path.split("/")
+        for idx in range(1, len(parts)):
+            dirpath = "/".join(parts[:idx]) or "/"
+            ftype = "/" if idx < len(parts) - 1 else ""
+            dirs.setdefault(dirpath, {}).setdefault(parts[idx], ftype)
+
+    return dirs
+
+# The commands mocked by 'mock_Proc.run_verify()' and the '_get_mocked_data()' keys of their output.
+_MOCKED_CMDS = {
+    # The call from CPUInfo.get_lscpu_info().
+    "lscpu": "lscpu",
+    # The call from CPUInfo.CPUInfo._get_lscpu().
+    "lscpu --all -p=socket,node,core,cpu,online": "lscpu_cpus",
+}
+_FIND_RE = re.compile("find '.*' -type f -regextype posix-extended -regex")
 
 #pylint: disable=unused-argument
 #pylint: disable=unused-variable
@@ -72,19 +148,16 @@ class mock_Proc(Procs.Proc):
         relevant to the tests. Otherwise pass call to original method.
         """
 
-        if re.match("find '.*' -type f -regextype posix-extended -regex", command):
-            # Mock the call from CPUIdle._get_cstates_info().
-            return (_MOCKED_DATA['cstates'], "")
+        key = _MOCKED_CMDS.get(command)
+        if key:
+            return (_get_mocked_data()[key], "")
 
-        if command == "lscpu":
-            # Mock the call from CPUInfo.get_lscpu_info().
-            return (_MOCKED_DATA['lscpu'], "")
-
-        if command == "lscpu --all -p=socket,node,core,cpu,online":
-            # Mock the call from CPUInfo.CPUInfo._get_lscpu().
-            return (_MOCKED_DATA['lscpu_cpus'], "")
+        if _FIND_RE.match(command):
+            # Mock the call from CPUIdle._get_cstates_info().
+            return (_get_mocked_data()['cstates'], "")
 
-        return self._parent_methods["run_verify"](command, **kwargs)
+        # 'Proc' does not have the 'run_verify()' method, it maps it to the module function.
+        return Procs.run_verify(command, **kwargs)
 
     def _get_mock_fobj(self, path, mode):
         """Prepare new file object."""
@@ -97,16 +170,16 @@ class mock_Proc(Procs.Proc):
             # Get last write value.
             read_data = self._mock_fobj[path].write.call_args.args[-1].strip()
         else:
-            read_data = _MOCKED_FILES[str(path)]
+            read_data = _get_mocked_files()[str(path)]
 
-        with patch("builtins.open", new_callable=mock_open, read_data=read_data) as m:
-            self._mock_fobj[path] = open(path, mode)
+        # Call the 'mock_open()' object directly, there is no need to patch 'builtins.open'.
+        self._mock_fobj[path] = mock_open(read_data=read_data)(path, mode)
         return self._mock_fobj[path]
 
     def open(self, path, mode):
         """Mocked 'open()'."""
 
-        if str(path) in _MOCKED_FILES:
+        if str(path) in _get_mocked_files():
             return self._get_mock_fobj(path, mode)
 
         return super().open(path, mode)
@@ -118,11 +191,34 @@ class mock_Proc(Procs.Proc):
 
         self._mock_fobj = {}
 
-        self._parent_methods = {}
-        module = sys.modules[Procs.__name__]
-        for name in ("run_verify",):
-            if hasattr(module, name):
-                self._parent_methods[name] = getattr(module, name)
+class mock_RemoteProc(Procs.Proc):
+    """
+    A 'Proc' object which pretends to be a remote host 'SSH' object: it runs commands with 'sh -c',
+    the same way as 'SSH' does. The commands are saved in 'self.cmds'.
+    """
+
+    def run(self, command, **kwargs):
+        """Run 'command' with 'sh -c' and save it in 'self.cmds'."""
+
+        # The command is always run by the shell, like 'SSH' does.
+        kwargs.pop("shell", None)
+        self.cmds.append(command)
+        return Procs.run(["sh", "-c", command], **kwargs)
+
+    def run_verify(self, command, **kwargs):
+        """Same as 'run()', but raise an exception if the command fails."""
+
+        result = self.run(command, **kwargs)
+        if result.exitcode:
+            raise Error(f"command '{command}' failed with exit code {result.exitcode}")
+        return (result.stdout, result.stderr)
+
+    def __init__(self):
+        """Initialize mock class instance."""
+
+        super().__init__()
+        self.is_remote = True
+        self.cmds = []
 
 class mock_MSR(MSR.MSR):
     """Mock version of MSR class in pepclibs.msr.MSR module."""
@@ -130,10 +226,8 @@ class mock_MSR(MSR.MSR):
     def read_iter(self, regaddr, regsize=8, cpus="all"):
         """Mocked version of 'read_iter()'. Returns random data."""
 
-        if regaddr in self._mocked_msr:
-            mask = (1 << 8 * regsize) - 1
-            read_data = int.to_bytes(self._mocked_msr[regaddr] & mask, regsize, byteorder="little")
-        else:
+        read_data = self._mocked_msr_bytes.get((regaddr, regsize))
+        if read_data is None:
             read_data = random.randbytes(regsize)
 
         with patch("builtins.open", new_callable=mock_open, read_data=read_data) as m_open:
@@ -147,45 +241,59 @@ class mock_MSR(MSR.MSR):
         # Use known values for Package C-state limits.
         self._mocked_msr[PCStateConfigCtl.MSR_PKG_CST_CONFIG_CONTROL] = 0x14000402
 
+        # The mocked MSR values as bytes, for every supported register size.
+        self._mocked_msr_bytes = {}
+        for regaddr, regval in self._mocked_msr.items():
+            for regsize in (4, 8):
+                mask = (1 << 8 * regsize) - 1
+                self._mocked_msr_bytes[(regaddr, regsize)] = \
+                    int.to_bytes(regval & mask, regsize, byteorder="little")
+
 def mock_lsdir(path: Path, must_exist: bool = True, proc=None):
     """Mock version of 'lsdir' function in FSHelpers module."""
 
-    m_paths = [Path(m_path) for m_path in _MOCKED_FILES if str(path) in m_path]
+    entries = _get_mocked_dirs().get(str(path))
 
-    if not m_paths:
+    if not entries:
         yield from FSHelpers.lsdir(path, must_exist=must_exist, proc=proc)
     else:
         # Use test data to generate output similar to 'lsdir()'.
-        entries = []
-        for m_path in m_paths:
-            einfo = {}
-            m_path = m_path.relative_to(path)
-            einfo["name"] = m_path.parts[0]
-            einfo["ftype"] = "/" if len(m_path.parts) > 1 else ""
+        for name, ftype in entries.items():
+            yield (name, path / name, ftype)
 
-            if einfo not in entries:
-                entries.append(einfo)
+# The objects mocked by 'get_mocked_objects()' and their mocked versions.
+_MOCKS = (("pepclibs.helperlibs.FSHelpers.lsdir", mock_lsdir),
+          ("pepclibs.helperlibs.Procs.Proc", mock_Proc),
+          ("pepclibs.msr.MSR.MSR", mock_MSR))
 
-        for einfo in entries:
-            yield (einfo["name"], path / einfo["name"], einfo["ftype"])
+# The tuple of objects yielded by 'get_mocked_objects()' while the mocks are installed.
+_MOCKED_OBJECTS = None
 
 @contextmanager
 def get_mocked_objects():
     """
     Helper function to mock 'lsdir()' function in FSHelpers module, Proc and MSR classes. Returns
-    objects as tuple.
+    objects as tuple. If the mocks are already installed by an outer 'get_mocked_objects()', they
+    are re-used rather than installed again.
     """
 
-    with patch("pepclibs.helperlibs.FSHelpers.lsdir", new=mock_lsdir) as mock_FSHelpers_lsdir, \
-         patch("pepclibs.helperlibs.Procs.Proc", new=mock_Proc) as mock_proc, \
-         patch("pepclibs.msr.MSR.MSR", new=mock_MSR) as mock_msr:
-        yield (mock_FSHelpers_lsdir, mock_proc, mock_msr)
+    global _MOCKED_OBJECTS # pylint: disable=global-statement
 
-def get_test_cpu_info():
-    """
-    Helper function to return information about the emulated CPU. Emulated methods are same as in
-    'get_mocked_objects()'. Returns information as a dictionary.
-    """
+    if _MOCKED_OBJECTS:
+        yield _MOCKED_OBJECTS
+        return
+
+    with ExitStack() as stack:
+        _MOCKED_OBJECTS = tuple(stack.enter_context(patch(target, new=new))
+                                for target, new in _MOCKS)
+        try:
+            yield _MOCKED_OBJECTS
+        finally:
+            _MOCKED_OBJECTS = None
+
+@functools.lru_cache(maxsize=None)
+def _get_test_cpu_info():
+    """Implements 'get_test_cpu_info()'."""
 
     with get_mocked_objects() as _, CPUInfo.CPUInfo() as cpuinfo:
         result = {}
@@ -198,6 +306,15 @@ def get_test_cpu_info():
 
         return result
 
+def get_test_cpu_info():
+    """
+    Helper function to return information about the emulated CPU. Emulated methods are same as in
+    'get_mocked_objects()'. Returns information as a dictionary. The information is gathered only
+    once, and callers get a copy of it.
+    """
+
+    return copy.deepcopy(_get_test_cpu_info())
+
 def run_pepc(arguments, exp_ret=None):
     """
     Run the 'pepc' command with arguments 'arguments'. Use mocked objects described in
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2020-2021 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test module for the 'CPUFreq' module."""
+
+# pylint: disable=protected-access
+
+from common import mock_RemoteProc
+from pepclibs import CPUFreq
+from pepclibs.helperlibs import KernelModule
+from pepclibs.helperlibs.Exceptions import Error
+
+_CPUS = [0, 1]
+
+class _FakeCPUInfo:
+    """A fake 'CPUInfo' object of a host with CPUs in '_CPUS' and without EPP and EPB support."""
+
+    @staticmethod
+    def get_cpu_list(cpus):
+        """Return the list of CPUs in 'cpus'."""
+
+        if cpus == "all":
+            return list(_CPUS)
+        return list(cpus)
+
+    @staticmethod
+    def get_lscpu_info():
+        """Return the 'lscpu' information needed by 'CPUFreq'."""
+
+        return {"vendor": "GenuineIntel", "flags": ""}
+
+    def close(self):
+        """Fake version of 'CPUInfo.close()'."""
+
+def _no_kernel_module(proc, name, **kwargs):
+    """Do not load kernel modules in the tests."""
+
+    raise Error(f"not loading kernel module '{name}'{proc.hostmsg}")
+
+def _get_cpufreq(basedir, monkeypatch):
+    """
+    Create the cpufreq sysfs files in 'basedir' and return a 'mock_RemoteProc' object and a
+    'CPUFreq' object using the files.
+    """
+
+    for cpu in _CPUS:
+        policydir = basedir / "cpufreq" / f"policy{cpu}"
+        policydir.mkdir(parents=True)
+        (policydir / "scaling_governor").write_text("powersave\n")
+        (policydir / "scaling_available_governors").write_text("performance powersave\n")
+        (policydir / "scaling_min_freq").write_text("800000\n")
+        (policydir / "scaling_max_freq").write_text("2000000\n")
+
+    monkeypatch.setattr(KernelModule, "KernelModule", _no_kernel_module)
+
+    proc = mock_RemoteProc()
+    cpufreq = CPUFreq.CPUFreq(proc=proc, cpuinfo=_FakeCPUInfo())
+    cpufreq._sysfs_base = basedir
+    proc.cmds = []
+
+    return proc, cpufreq
+
+def test_get_cpufreq_info_remote(tmp_path, monkeypatch):
+    """Test that the cpufreq sysfs files on a remote host are read with a single command."""
+
+    proc, cpufreq = _get_cpufreq(tmp_path, monkeypatch)
+
+    with cpufreq:
+        keys = ("cpu", "governor", "min", "max")
+        for cpu, info in zip(_CPUS, cpufreq.get_cpufreq_info(_CPUS, keys=keys)):
+            assert info == {"cpu": cpu, "governor": "powersave", "min": 800000, "max": 2000000}
+
+        assert len(proc.cmds) == 1
+        assert proc.cmds[0].startswith("grep ")
+        assert not cpufreq._sysfs_cache
+
+def test_get_cpufreq_info_remote_nested(tmp_path, monkeypatch):
+    """
+    Test that changes made while iterating over 'get_cpufreq_info()' are visible, including the
+    changes made by methods which call 'get_cpufreq_info()' themselves.
+    """
+
+    _, cpufreq = _get_cpufreq(tmp_path, monkeypatch)
+
+    with cpufreq:
+        infos = cpufreq.get_cpufreq_info(_CPUS, keys=("cpu", "governor"))
+        assert next(infos)["governor"] == "powersave"
+
+        cpufreq.set_governor("performance", cpus=[1])
+        info = next(cpufreq.get_cpufreq_info([1], keys=("governor",)))
+        assert info["governor"] == "performance"
+
+        # The nested calls should not drop the values prefetched by the outer call.
+        assert cpufreq._sysfs_cache
+        assert next(infos)["governor"] == "performance"
+
+        infos.close()
+        assert not cpufreq._sysfs_cache
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2020-2021 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test module for the 'CPUInfo' module."""
+
+from common import get_mocked_objects
+from pepclibs import CPUInfo
+
+def test_default_proc_cache():
+    """
+    Test that 'CPUInfo' objects created without the 'proc' argument share the CPU geometry, and that
+    'invalidate_cache()' drops it.
+    """
+
+    with get_mocked_objects():
+        with CPUInfo.CPUInfo() as cpuinfo:
+            cpugeom = cpuinfo.get_cpu_geometry()
+        with CPUInfo.CPUInfo() as cpuinfo:
+            assert cpuinfo.get_cpu_geometry() is cpugeom
+
+        CPUInfo.CPUInfo.invalidate_cache()
+        with CPUInfo.CPUInfo() as cpuinfo:
+            assert cpuinfo.get_cpu_geometry() is not cpugeom
+
+def test_cpu_descr():
+    """Test that 'cpu_descr()' returns the default value for unknown CPU models."""
+
+    model = next(iter(CPUInfo.CPU_DESCR))
+    assert CPUInfo.cpu_descr(model, default="Unknown") == CPUInfo.CPU_DESCR[model]
+
+    model = next(model for model in range(0x100) if model not in CPUInfo.CPU_DESCR)
+    assert CPUInfo.cpu_descr(model) is None
+    assert CPUInfo.cpu_descr(model, default=hex(model)) == hex(model)
+    assert CPUInfo.cpu_descr(0x1000, default="Unknown") == "Unknown"
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2020-2021 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test module for the 'CPUOnline' module."""
+
+# pylint: disable=protected-access
+
+import pytest
+from common import mock_RemoteProc
+from pepclibs import CPUInfo, CPUOnline
+from pepclibs.helperlibs.Exceptions import Error
+
+class _FailingRemoteProc(mock_RemoteProc):
+    """A 'mock_RemoteProc' object which fails to online or offline CPU 'fail_cpu'."""
+
+    def run(self, command, **kwargs):
+        """Run 'command', but make the write to the 'online' file of CPU 'self.fail_cpu' fail."""
+
+        if command.startswith("for cpu in "):
+            command = f"echo() {{ [ \"$cpu\" != {self.fail_cpu} ] && command echo \"$@\"; }}; " \
+                      f"{command}"
+        return super().run(command, **kwargs)
+
+    def __init__(self, fail_cpu):
+        """Initialize mock class instance."""
+
+        super().__init__()
+        self.fail_cpu = fail_cpu
+
+def _create_cpus(basedir, states):
+    """
+    Create the 'online' sysfs files in 'basedir' for CPUs in the 'states' dictionary, which maps CPU
+    numbers to their states.
+    """
+
+    for cpu, state in states.items():
+        (basedir / f"cpu{cpu}").mkdir()
+        (basedir / f"cpu{cpu}" / "online").write_text(f"{state}\n")
+
+def _get_states(basedir, cpus):
+    """Return a dictionary with states of CPUs in 'cpus' read from their 'online' files."""
+
+    return {cpu: (basedir / f"cpu{cpu}" / "online").read_text().strip() for cpu in cpus}
+
+def test_toggle_batch(tmp_path, monkeypatch):
+    """
+    Test that CPUs on a remote host are onlined with a single command, and the CPU topology cache
+    is invalidated.
+    """
+
+    invalidated = []
+    monkeypatch.setattr(CPUInfo.CPUInfo, "invalidate_cache", lambda *args: invalidated.append(args))
+
+    _create_cpus(tmp_path, {1: 0, 2: 1, 3: 0})
+
+    proc = mock_RemoteProc()
+    with CPUOnline.CPUOnline(proc=proc) as cpuonline:
+        cpuonline._sysfs_base = tmp_path
+        cpuonline.online([1, 2, 3])
+
+        assert _get_states(tmp_path, (1, 2, 3)) == {1: "1", 2: "1", 3: "1"}
+        assert cpuonline._saved_states == {1: False, 2: True, 3: False}
+
+    # One command reads the states, one writes them, and one verifies them.
+    assert len(proc.cmds) == 3
+    assert proc.cmds[1].startswith("for cpu in 1 2 3;")
+    # The entire CPU topology cache is dropped.
+    assert invalidated == [()]
+
+def test_toggle_batch_failure(tmp_path, monkeypatch):
+    """
+    Test that failing to offline a CPU on a remote host raises an exception, and that the CPUs
+    offlined before the failure are saved and the CPU topology cache is invalidated.
+    """
+
+    invalidated = []
+    monkeypatch.setattr(CPUInfo.CPUInfo, "invalidate_cache", lambda *args: invalidated.append(args))
+
+    _create_cpus(tmp_path, {1: 1, 2: 1, 3: 1})
+
+    proc = _FailingRemoteProc(2)
+    with CPUOnline.CPUOnline(proc=proc) as cpuonline:
+        cpuonline._sysfs_base = tmp_path
+        with pytest.raises(Error, match="failed to offline CPU2"):
+            cpuonline.offline([1, 2, 3])
+
+        # The CPUs are toggled in order, so CPU3 should not be toggled.
+        assert _get_states(tmp_path, (1, 3)) == {1: "0", 3: "1"}
+        assert cpuonline._saved_states == {1: True}
+
+    # The entire CPU topology cache is dropped.
+    assert invalidated == [()]
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2020-2021 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test module for the 'FSHelpers' module."""
+
+from common import mock_RemoteProc
+from pepclibs.helperlibs import FSHelpers
+
+def _create_files(basedir, count):
+    """
+    Create 'count' files in 'basedir' and return a dictionary with file path as key and the stripped
+    file contents as value.
+    """
+
+    files = {}
+    for idx in range(count):
+        path = basedir / f"file{idx}"
+        path.write_text(f" value {idx}\n")
+        files[path] = f"value {idx}"
+
+    return files
+
+def test_read_files_local(tmp_path):
+    """Test 'read_files()' on the local host, including files that do not exist."""
+
+    files = _create_files(tmp_path, 4)
+    paths = list(files) + [tmp_path / "nonexistent"]
+
+    assert FSHelpers.read_files(paths) == files
+    assert not FSHelpers.read_files([])
+
+def test_read_files_remote(tmp_path):
+    """
+    Test 'read_files()' on a remote host. Files that do not exist make the command fail, but the
+    other files should still be read, and all of them with a single command.
+    """
+
+    files = _create_files(tmp_path, 4)
+    paths = list(files) + [tmp_path / "nonexistent"]
+
+    proc = mock_RemoteProc()
+    assert FSHelpers.read_files(paths, proc=proc) == files
+    assert len(proc.cmds) == 1
+
+def test_read_files_remote_batches(tmp_path, monkeypatch):
+    """Test that 'read_files()' splits the paths into commands that fit the length limit."""
+
+    cmd_max = 256
+    monkeypatch.setattr(FSHelpers, "_READ_FILES_CMD_MAX", cmd_max)
+
+    files = _create_files(tmp_path, 20)
+
+    proc = mock_RemoteProc()
+    assert FSHelpers.read_files(files, proc=proc) == files
+    assert len(proc.cmds) > 1
+    for cmd in proc.cmds:
+        assert len(cmd) <= cmd_max
+
+def test_read_files_empty(tmp_path):
+    """
+    Test 'read_files()' with an empty file, which is included in the result on the local host, but
+    not on a remote host.
+    """
+
+    files = _create_files(tmp_path, 2)
+    empty = tmp_path / "empty"
+    empty.write_text("")
+    paths = list(files) + [empty]
+
+    assert FSHelpers.read_files(paths) == {**files, empty: ""}
+    assert FSHelpers.read_files(paths, proc=mock_RemoteProc()) == files
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2020-2021 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test module for 'pepc' project command-line arguments parsing."""
+
+import sys
+import pytest
+from pepclibs import pepc
+from pepclibs.helperlibs.Exceptions import Error
+
+def _parse_args(arguments):
+    """Parse 'arguments' the same way 'pepc' parses its command line and return the result."""
+
+    sys.argv = [f"{pepc.__file__}"] + arguments.split()
+    return pepc.parse_arguments()
+
+def test_ssh_options_before_command():
+    """Test that SSH options and their values before the command are not taken for the command."""
+
+    good_args = (("-H myhost cstates info", pepc.cstates_info_command),
+                 ("--host myhost cstates info", pepc.cstates_info_command),
+                 ("--hos myhost cstates info", pepc.cstates_info_command),
+                 ("--user root -H myhost pstates info", pepc.pstates_info_command),
+                 ("-q --user root --ho myhost aspm info", pepc.aspm_info_command),
+                 ("-H myhost cpu-hotplug info", pepc.cpu_hotplug_info_command))
+
+    for arguments, func in good_args:
+        args = _parse_args(arguments)
+        assert args.hostname == "myhost"
+        assert args.username == "root"
+        assert args.func is func
+
+def test_ssh_option_value_is_command_name():
+    """Test SSH option values which are also command names."""
+
+    for arguments in ("-H cstates pstates info", "--hos cstates pstates info"):
+        args = _parse_args(arguments)
+        assert args.hostname == "cstates"
+        assert args.func is pepc.pstates_info_command
+
+def test_ssh_options_after_command():
+    """
+    Test SSH options after the command: a negative number is taken for the option value, while
+    other options are still recognized.
+    """
+
+    args = _parse_args("cstates info -T -1")
+    assert args.timeout == "-1"
+    assert args.func is pepc.cstates_info_command
+
+    args = _parse_args("cstates info -H myhost -T -1 -q")
+    assert args.hostname == "myhost"
+    assert args.timeout == "-1"
+    assert args.quiet
+
+    for arguments in ("cstates info -H", "cstates info -H -q", "cstates info -T -x"):
+        with pytest.raises(Error, match="value required"):
+            _parse_args(arguments)
+
+    with pytest.raises(Error, match="unrecognized option"):
+        _parse_args("cstates info -T -1 -x")
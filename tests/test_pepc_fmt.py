@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2020-2021 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test module for the 'pepc' project values formatting."""
+
+from pepclibs import pepc
+
+def test_khz_fmt():
+    """Test 'khz_fmt()' with whole and fractional values, including the unit boundaries."""
+
+    good_vals = ((0, "0kHz"),
+                 (999, "999kHz"),
+                 (1000, "1MHz"),
+                 (1500, "1.5MHz"),
+                 (800001, "800.001MHz"),
+                 (999999, "999.999MHz"),
+                 (1000000, "1GHz"),
+                 (2000000, "2GHz"),
+                 (2400000, "2.4GHz"),
+                 (1234567, "1.235GHz"),
+                 (1999999, "2GHz"),
+                 (5000000000, "5000GHz"))
+
+    for val, result in good_vals:
+        assert pepc.khz_fmt(val) == result
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2020-2021 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test module for 'pepc' project 'pstates' command."""
+
+from pepclibs import pepc
+from pepclibs.helperlibs import Procs
+
+class _FakePStates:
+    """A fake 'CPUFreq' object providing the governor of every CPU."""
+
+    def get_cpufreq_info(self, cpus, keys=None): # pylint: disable=unused-argument
+        """Yield the 'acpi-cpufreq' driver and the 'self.governor' governor for CPUs in 'cpus'."""
+
+        for cpu in cpus:
+            yield {"cpu": cpu, "driver": "acpi-cpufreq", "governor": self.governor}
+
+    def __init__(self, governor):
+        """Initialize a class instance."""
+
+        self.governor = governor
+
+def test_warn_static_governors(caplog):
+    """
+    Test that changing a CPU frequency limit warns only if the governor ignores the limit: the
+    minimum limit for the 'performance' governor and the maximum limit for the 'powersave' governor.
+    """
+
+    proc = Procs.Proc()
+    warns = (("performance", "1GHz", None, True),
+             ("performance", None, "2GHz", False),
+             ("performance", "1GHz", "2GHz", True),
+             ("powersave", "1GHz", None, False),
+             ("powersave", None, "2GHz", True),
+             ("powersave", "1GHz", "2GHz", True),
+             ("schedutil", "1GHz", "2GHz", False))
+
+    for governor, minfreq, maxfreq, warn in warns:
+        caplog.clear()
+        pepc.warn_static_governors(proc, _FakePStates(governor), [0, 1], minfreq, maxfreq)
+        assert bool(caplog.records) == warn